@@ -1,21 +1,19 @@
 import argparse
-import csv
 import datetime
-import getpass
 import os
-import socket
 import sys
 
 from constants import TRANSFER_LOG_HEADERS
 from models.log_model import TransferLog
 from models.request_model import RequestLog
 from utils.cli_utils import (
+    PROGRESS_PERCENTAGES,
     collect_files,
     compute_hashes,
-    format_timestamp,
     resolve_output_folder,
 )
 from utils.config_manager import ConfigManager
+from utils.file_utils import append_csv_row, fsync_enabled, get_hostname, get_username
 from version import VERSION
 
 
@@ -53,11 +51,8 @@ def run_cli():
     config_path = os.path.join(config_dir, "config.ini")
     config = ConfigManager(config_path)
 
-    # Get transfer types from configuration
-    transfer_types = config.get_transfer_types()
-
-    # Build a set of all valid options (long and short)
-    valid_transfer_types = set(transfer_types.keys()) | set(transfer_types.values())
+    # Get all valid transfer type options (long and short) from configuration
+    valid_transfer_types = config.get_valid_transfer_types()
 
     parser = argparse.ArgumentParser(description="DTA File Transfer Log CLI")
     parser.add_argument("--media-type", required=True, help="Media type")
@@ -104,8 +99,8 @@ def run_cli():
         config=config,
         timestamp=datetime.datetime.now().strftime("%Y%m%d-%H%M%S"),
         transfer_date=datetime.datetime.now().strftime("%m/%d/%Y"),
-        username=getpass.getuser(),
-        computer_name=socket.gethostname(),
+        username=get_username(),
+        computer_name=get_hostname(),
         media_type=args.media_type,
         media_id=args.media_id,
         transfer_type=args.transfer_type,
@@ -119,7 +114,7 @@ def run_cli():
     file_hashes = {}
     if args.sha256:
         print("Calculating SHA-256 hashes...")
-        file_hashes = compute_hashes(all_files, algorithm='sha256', print_fn=print, progress_step=10)
+        file_hashes = compute_hashes(all_files, algorithm='sha256', print_fn=print)
 
     # Save file list
     print("Generating file list...")
@@ -134,7 +129,7 @@ def run_cli():
     csv_file = os.path.join(log_output_folder, f"TransferLog_{year}.log")
 
     # Format timestamp for CSV
-    formatted_timestamp = format_timestamp(transfer_log.timestamp)
+    formatted_timestamp = transfer_log.formatted_timestamp
 
     # Format transfer data for CSV
     fields = [
@@ -153,13 +148,8 @@ def run_cli():
         file_list_path
     ]
 
-    # Write CSV entry
-    file_exists = os.path.isfile(csv_file)
-    with open(csv_file, 'a', newline='') as f:
-        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-        if not file_exists:
-            writer.writerow(TRANSFER_LOG_HEADERS)
-        writer.writerow(fields)
+    # Write CSV entry (headers first if the file is new)
+    append_csv_row(csv_file, fields, TRANSFER_LOG_HEADERS, sync=fsync_enabled(config))
 
     print(f"Transfer log updated: {csv_file}")
     print(f"File list saved: {file_list_path}")
@@ -220,7 +210,7 @@ def run_request_cli():
         request_date = datetime.datetime.now().strftime("%m/%d/%Y")
 
     # Set computer name
-    computer_name = args.computer_name if args.computer_name else socket.gethostname()
+    computer_name = args.computer_name if args.computer_name else get_hostname()
 
     # Collect all files from --files and recursively from --folders
     all_files = collect_files(args.files, args.folders, original_cwd, print)
@@ -262,29 +252,26 @@ def run_request_cli():
     file_hashes = {}
     if args.sha256:
         print("Calculating SHA-256 hashes...")
-        file_hashes = compute_hashes(all_files, algorithm='sha256', print_fn=print, progress_step=10)
+        file_hashes = compute_hashes(all_files, algorithm='sha256', print_fn=print)
 
     # Save file list using the request model's method
     print("Generating request file list...")
 
-    # Create a simple progress callback for CLI
+    # Create a simple progress callback for CLI that prints once per checkpoint reached
+    pending_checkpoints = list(PROGRESS_PERCENTAGES)
+
     def progress_callback_cli(progress):
-        if progress % 10 == 0:  # Print every 10%
+        if pending_checkpoints and progress >= pending_checkpoints[0]:
+            while pending_checkpoints and progress >= pending_checkpoints[0]:
+                pending_checkpoints.pop(0)
             print(f"Progress: {progress}%")
 
     # Create a simple cancellation callback (never canceled in CLI)
     def is_canceled_callback():
         return False
 
-    # Use a mock progress signal for CLI
-    class MockProgressSignal:
-        def emit(self, value):
-            progress_callback_cli(value)
-
-    mock_progress = MockProgressSignal()
-
     file_list_path = request_log._save_file_list_with_progress(
-        file_list_dir, all_files, file_hashes, mock_progress, is_canceled_callback)
+        file_list_dir, all_files, file_hashes, progress_callback_cli, is_canceled_callback)
 
     if not file_list_path:
         print("Error: Failed to save request file list")
@@ -299,7 +286,7 @@ def run_request_cli():
         csv_file = os.path.join(request_output_folder, request_log_name)
 
         # Format timestamp for CSV
-        formatted_timestamp = format_timestamp(request_log.timestamp)
+        formatted_timestamp = request_log.formatted_timestamp
 
         # Write to request log
         request_log._save_request_log(csv_file, formatted_timestamp, file_list_path)
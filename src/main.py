@@ -217,16 +217,20 @@ def main():
         else:
             print(f"Warning: Theme '{theme}' specified in config.ini was not found.")
 
-    # Check command line args for review mode and show help for CLI modes
-    parser = create_gui_parser()
-    args = parser.parse_args()
+    # Check command line args for review mode and show help for CLI modes.
+    # A plain GUI launch has no arguments, so skip building the parser entirely.
+    tab_arg = None
+    if len(sys.argv) > 1:
+        parser = create_gui_parser()
+        args = parser.parse_args()
+        tab_arg = args.tab
 
     # Create the main application window with tabs
     window = DTATransferLogApp(config)
 
     # Set the starting tab based on --tab argument or config default
-    if args.tab:
-        tab_index = parse_tab_argument(args.tab)
+    if tab_arg:
+        tab_index = parse_tab_argument(tab_arg)
     else:
         # Check config for default tab
         default_tab = config.get("UI", "DefaultTab", fallback="")
@@ -1,6 +1,6 @@
 from typing import Any
 
-from utils.file_utils import FileInfo, get_file_size_str
+from utils.file_utils import FileInfo, format_timestamp, get_file_size_str
 
 
 class BaseLogModel:
@@ -14,6 +14,11 @@ class BaseLogModel:
         self.total_size = total_size
         self.files: list[FileInfo] = []
 
+    @property
+    def formatted_timestamp(self) -> str:
+        """Get the timestamp as YYYY-MM-DD HH:MM:SS for log entries"""
+        return format_timestamp(self.timestamp)
+
     def add_file(self, file_info: FileInfo):
         """Add a file to the log"""
         self.files.append(file_info)
@@ -1,10 +1,9 @@
-import csv
 import os
 
 from constants import FILE_LIST_HEADERS
 from models.base_model import BaseLogModel
 from utils.file_list_writer import save_file_list_with_progress
-from utils.file_utils import format_display_path, format_filename
+from utils.file_utils import append_csv_row, format_display_path, format_filename, fsync_enabled
 
 
 class TransferLog(BaseLogModel):
@@ -27,14 +26,12 @@ class TransferLog(BaseLogModel):
         self.destination = destination
         self.request_id = request_id
 
-    def save(self, log_dir: str, files: list[str], file_hashes: dict[str, str] | None = None) -> str:
-        """Save the transfer log to CSV format with archive processing"""
-        # Get the transfer log filename template from config
-        template = self.config.get("Logging", "TransferLogName",
-                                  fallback="TransferLog_{year}.log")
-
-        # Prepare data for token replacement
-        data = {
+        # Filename templates and token data are fixed for the lifetime of a log entry
+        self._transfer_log_template = self.config.get("Logging", "TransferLogName",
+                                                      fallback="TransferLog_{year}.log")
+        self._file_list_template = self.config.get("Logging", "FileListName",
+                                                   fallback="{timestamp}_{username}_{transfertype}_{source}-{destination}_FileList.csv")
+        self._template_data = {
             'transfertype': self.transfer_type,
             'source': self.source,
             'destination': self.destination,
@@ -44,22 +41,17 @@ class TransferLog(BaseLogModel):
             'computername': self.computer_name
         }
 
+    def save(self, log_dir: str, files: list[str], file_hashes: dict[str, str] | None = None) -> str:
+        """Save the transfer log to CSV format with archive processing"""
         # Format the filename using the token system
-        log_filename = format_filename(template, data, self.config)
+        log_filename = format_filename(self._transfer_log_template, self._template_data, self.config)
         csv_file = os.path.join(log_dir, log_filename)
 
-        # Check if file exists to determine if we need to write headers
-        file_exists = os.path.isfile(csv_file)
-
         file_list_path = self._save_file_list(log_dir, files, file_hashes)
 
-        # Format timestamp for CSV
-        ts = self.timestamp
-        formatted_timestamp = f"{ts[0:4]}-{ts[4:6]}-{ts[6:8]} {ts[9:11]}:{ts[11:13]}:{ts[13:15]}"
-
         # Format transfer data for CSV
         fields = [
-            formatted_timestamp,
+            self.formatted_timestamp,
             self.transfer_date,
             self.username,
             self.computer_name,
@@ -73,19 +65,12 @@ class TransferLog(BaseLogModel):
             file_list_path
         ]
 
-        # Write the log entry to the CSV file
-        with open(csv_file, 'a', newline='') as f:
-            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-
-            # Write headers if file is new
-            if not file_exists:
-                writer.writerow([
-                    "Timestamp", "Transfer Date", "Username", "Computer Name",
-                    "Media Type", "Media ID", "Transfer Type", "Source",
-                    "Destination", "File Count", "Total Size", "File Log"
-                ])
-
-            writer.writerow(fields)
+        # Write the log entry to the CSV file (headers first if the file is new)
+        append_csv_row(csv_file, fields, [
+            "Timestamp", "Transfer Date", "Username", "Computer Name",
+            "Media Type", "Media ID", "Transfer Type", "Source",
+            "Destination", "File Count", "Total Size", "File Log"
+        ], sync=fsync_enabled(self.config))
 
         return file_list_path
 
@@ -104,21 +89,8 @@ class TransferLog(BaseLogModel):
                                  file_hashes: dict[str, str] | None = None,
                                  progress_signal=None, cancel_check=None) -> str:
         """Save detailed file list with archive contents to CSV with progress reporting"""
-        # Get filename template from config
-        template = self.config.get("Logging", "FileListName",
-                             fallback="{timestamp}_{username}_{transfertype}_{source}-{destination}_FileList.csv")
-
-        # Prepare data for token replacement
-        template_data = {
-            'transfertype': self.transfer_type,
-            'source': self.source,
-            'destination': self.destination,
-            'mediatype': self.media_type,
-            'mediaid': self.media_id,
-            'username': self.username,
-            'computername': self.computer_name,
-            'timestamp': self.timestamp
-        }
+        # File list names use the transfer's own timestamp for {timestamp}
+        template_data = {**self._template_data, 'timestamp': self.timestamp}
 
         # Use shared file list writer
         return save_file_list_with_progress(
@@ -126,7 +98,7 @@ class TransferLog(BaseLogModel):
             files=files,
             file_hashes=file_hashes,
             csv_headers=FILE_LIST_HEADERS,
-            filename_template=template,
+            filename_template=self._file_list_template,
             template_data=template_data,
             config=self.config,
             progress_callback=progress_signal,
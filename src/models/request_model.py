@@ -1,9 +1,7 @@
-import csv
-import os
-
 from constants import REQUEST_FILE_LIST_HEADERS, REQUEST_LOG_HEADERS
 from models.base_model import BaseLogModel
 from utils.file_list_writer import save_file_list_with_progress
+from utils.file_utils import append_csv_row, fsync_enabled
 
 
 class RequestLog(BaseLogModel):
@@ -17,28 +15,26 @@ class RequestLog(BaseLogModel):
         self.requestor = requestor
         self.purpose = purpose
 
-    def _save_file_list_with_progress(self, file_list_dir, selected_files, file_hashes, progress_callback, is_canceled_callback):
-        """Save the file list CSV with progress reporting"""
-        # Get filename template from config
-        template = self.config.get("Requests", "FileListName",
-                                  fallback="{date:yyyyMMdd}_{username}_Request_{counter}.csv")
-
-        # Prepare data for token replacement
-        template_data = {
+        # Filename template and token data are fixed for the lifetime of a request
+        self._file_list_template = self.config.get("Requests", "FileListName",
+                                                   fallback="{date:yyyyMMdd}_{username}_Request_{counter}.csv")
+        self._template_data = {
             'username': self.requestor,
             'computername': self.computer_name,
             'requestor': self.requestor,
             'purpose': self.purpose
         }
 
+    def _save_file_list_with_progress(self, file_list_dir, selected_files, file_hashes, progress_callback, is_canceled_callback):
+        """Save the file list CSV with progress reporting"""
         # Use shared file list writer
         return save_file_list_with_progress(
             output_dir=file_list_dir,
             files=selected_files,
             file_hashes=file_hashes,
             csv_headers=REQUEST_FILE_LIST_HEADERS,
-            filename_template=template,
-            template_data=template_data,
+            filename_template=self._file_list_template,
+            template_data=self._template_data,
             config=self.config,
             progress_callback=progress_callback,
             cancel_check=is_canceled_callback,
@@ -47,23 +43,14 @@ class RequestLog(BaseLogModel):
 
     def _save_request_log(self, csv_file, formatted_timestamp, file_list_path):
         """Save the request summary to the annual request log"""
-        # Write the log entry to the CSV file
-        file_exists = os.path.isfile(csv_file)
-        with open(csv_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-
-            # Write headers if file is new
-            if not file_exists:
-                writer.writerow(REQUEST_LOG_HEADERS)
-
-            # Write the request data
-            writer.writerow([
-                formatted_timestamp,
-                self.request_date,
-                self.requestor,
-                self.computer_name,
-                self.purpose,
-                str(self.file_count),
-                str(self.total_size),
-                file_list_path
-            ])
+        # Write the log entry to the CSV file (headers first if the file is new)
+        append_csv_row(csv_file, [
+            formatted_timestamp,
+            self.request_date,
+            self.requestor,
+            self.computer_name,
+            self.purpose,
+            str(self.file_count),
+            str(self.total_size),
+            file_list_path
+        ], REQUEST_LOG_HEADERS, sync=fsync_enabled(self.config))
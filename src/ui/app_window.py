@@ -2,7 +2,7 @@ import os
 import sys
 
 from PySide6.QtGui import QAction, QIcon
-from PySide6.QtWidgets import QMainWindow, QMessageBox, QTabWidget
+from PySide6.QtWidgets import QMainWindow, QMessageBox, QTabWidget, QWidget
 
 from ui.log_window import FileTransferLoggerTab
 from ui.request_window import FileTransferRequestTab
@@ -40,17 +40,24 @@ class DTATransferLogApp(QMainWindow):
         self.tab_widget = QTabWidget()
         self.setCentralWidget(self.tab_widget)
 
-        # Create request tab (first)
-        self.request_tab = FileTransferRequestTab(self.config, self)
-        self.tab_widget.addTab(self.request_tab, "Request")
-
-        # Create log tab (second)
-        self.log_tab = FileTransferLoggerTab(self.config, self)
-        self.tab_widget.addTab(self.log_tab, "Log")
-
-        # Create review tab (third)
-        self.review_tab = TransferLogReviewerTab(self.config, parent=self)
-        self.tab_widget.addTab(self.review_tab, "Review")
+        # Tabs are created the first time they are shown; until then a placeholder
+        # widget holds their place (the review tab scans every log when created)
+        self.request_tab = None
+        self.log_tab = None
+        self.review_tab = None
+        self._tab_factories = {
+            0: ("request_tab", "Request", lambda: FileTransferRequestTab(self.config, self)),
+            1: ("log_tab", "Log", lambda: FileTransferLoggerTab(self.config, self)),
+            2: ("review_tab", "Review", lambda: TransferLogReviewerTab(self.config, parent=self)),
+        }
+        self._created_tab_index = None
+        self._tab_actions = {}
+        for _attr, label, _factory in self._tab_factories.values():
+            self.tab_widget.addTab(QWidget(), label)
+
+        # Create the tab being switched to before the menu and toolbar are updated for it
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
+        self._ensure_tab(0)
 
         # Set up menu and toolbar
         self._setup_menu()
@@ -80,9 +87,6 @@ class DTATransferLogApp(QMainWindow):
         # File menu
         file_menu = menu_bar.addMenu("&File")
 
-        # Add actions for the current tab
-        self.tab_widget.currentChanged.connect(self._update_menu)
-
         # Exit action
         exit_action = QAction("E&xit", self)
         exit_action.setShortcut("Alt+F4")
@@ -105,8 +109,49 @@ class DTATransferLogApp(QMainWindow):
         self.toolbar = self.addToolBar("Main Toolbar")
         self.toolbar.setMovable(False)
 
-        # Actions will be updated based on the current tab
-        self.tab_widget.currentChanged.connect(self._update_toolbar)
+    def _ensure_tab(self, index):
+        """Create the tab at index if this is the first time it is shown"""
+        entry = self._tab_factories.pop(index, None)
+        if entry is None:
+            return
+        attr, label, factory = entry
+        tab = factory()
+        setattr(self, attr, tab)
+
+        # Swap the placeholder out without reporting the intermediate tab changes
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab, label)
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        self._created_tab_index = index
+
+    def _get_tab_actions(self, index):
+        """Return (menu actions, toolbar actions) for the tab at index
+
+        Tabs create new QActions on every get_*_actions() call, so each tab is
+        asked once and its actions are reused on later tab switches.
+        """
+        actions = self._tab_actions.get(index)
+        if actions is None:
+            if index == 0:  # Request tab
+                tab = self.request_tab
+            elif index == 1:  # Log tab
+                tab = self.log_tab
+            else:  # Review tab
+                tab = self.review_tab
+            if tab is None:
+                return [], []  # Not created yet
+
+            menu_actions = tab.get_menu_actions() if hasattr(tab, 'get_menu_actions') else []
+            toolbar_actions = tab.get_toolbar_actions() if hasattr(tab, 'get_toolbar_actions') else []
+            actions = (menu_actions, toolbar_actions)
+            self._tab_actions[index] = actions
+        return actions
 
     def _update_menu(self, index):
         """Update menu based on the active tab"""
@@ -114,21 +159,7 @@ class DTATransferLogApp(QMainWindow):
         self.tools_menu.clear()
 
         # Add tab-specific actions
-        if index == 0:  # Request tab
-            if hasattr(self.request_tab, 'get_menu_actions'):
-                actions = self.request_tab.get_menu_actions()
-                for action in actions:
-                    self.tools_menu.addAction(action)
-        elif index == 1:  # Log tab
-            if hasattr(self.log_tab, 'get_menu_actions'):
-                actions = self.log_tab.get_menu_actions()
-                for action in actions:
-                    self.tools_menu.addAction(action)
-        else:  # Review tab
-            if hasattr(self.review_tab, 'get_menu_actions'):
-                actions = self.review_tab.get_menu_actions()
-                for action in actions:
-                    self.tools_menu.addAction(action)
+        self.tools_menu.addActions(self._get_tab_actions(index)[0])
 
     def _update_toolbar(self, index):
         """Update toolbar based on the active tab"""
@@ -136,21 +167,7 @@ class DTATransferLogApp(QMainWindow):
         self.toolbar.clear()
 
         # Add tab-specific toolbar items
-        if index == 0:  # Request tab
-            if hasattr(self.request_tab, 'get_toolbar_actions'):
-                actions = self.request_tab.get_toolbar_actions()
-                for action in actions:
-                    self.toolbar.addAction(action)
-        elif index == 1:  # Log tab
-            if hasattr(self.log_tab, 'get_toolbar_actions'):
-                actions = self.log_tab.get_toolbar_actions()
-                for action in actions:
-                    self.toolbar.addAction(action)
-        else:  # Review tab
-            if hasattr(self.review_tab, 'get_toolbar_actions'):
-                actions = self.review_tab.get_toolbar_actions()
-                for action in actions:
-                    self.toolbar.addAction(action)
+        self.toolbar.addActions(self._get_tab_actions(index)[1])
 
     def show_about(self):
         """Display information about the application"""
@@ -169,14 +186,17 @@ class DTATransferLogApp(QMainWindow):
 
     def _on_tab_changed(self, index):
         """Handle tab change events"""
-        if index == 2:  # Review tab (now index 2 because Request is at index 1)
-            # Refresh log data when switching to review tab
+        # A tab created for this switch has only just loaded its data
+        created = self._created_tab_index == index
+        self._created_tab_index = None
+        if index == 2 and not created:  # Review tab (now index 2 because Request is at index 1)
+            # Refresh log data when switching back to review tab (a new tab has just loaded it)
             self.set_status_message("Refreshing log data...")
             self.review_tab.load_log_data()
 
     def on_config_reloaded(self):
         """Notify all tabs that configuration has been reloaded"""
         # Update review tab
-        if hasattr(self, 'review_tab'):
+        if self.review_tab is not None:
             self.review_tab.update_log_directory()
         self.set_status_message("All tabs updated with new configuration")
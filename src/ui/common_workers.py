@@ -6,10 +6,41 @@ UI components (log_window.py and request_window.py).
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from PySide6.QtCore import QThread, Signal
 
-from utils.file_utils import calculate_file_hash
+from utils.file_utils import MAX_HASH_WORKERS, calculate_file_hash, iter_files_with_sizes
+
+# Files found by a folder scan are handed to the UI thread in groups of this many
+SCAN_BATCH_SIZE = 500
+
+# Selections of at most this many files and bytes (as recorded when selected) are
+# hashed directly on the calling thread; starting a worker and showing a progress
+# dialog would take longer. The file cap bounds the work when sizes are stale or 0
+INLINE_HASH_MAX_BYTES = 64 * 1024
+INLINE_HASH_MAX_FILES = 8
+
+
+def _hash_file(file):
+    """Calculate the hash of one file, returning an "ERROR: ..." string on failure"""
+    try:
+        return calculate_file_hash(file)
+    except Exception as e:
+        return f"ERROR: {e!s}"
+
+
+def hash_files(files):
+    """
+    Calculate hashes for a few small files without a worker thread.
+
+    Args:
+        files: List of file paths to calculate hashes for
+
+    Returns:
+        Dictionary mapping file paths to hash values, as FileHashWorker emits
+    """
+    return {file: _hash_file(file) for file in files}
 
 
 class FileHashWorker(QThread):
@@ -26,15 +57,18 @@ class FileHashWorker(QThread):
     progress = Signal(int)
     finished = Signal(dict)
 
-    def __init__(self, files):
+    def __init__(self, files, file_sizes=None):
         """
         Initialize the hash worker.
 
         Args:
             files: List of file paths to calculate hashes for
+            file_sizes: Optional dictionary mapping file paths to sizes, used to
+                        hash the largest files first
         """
         super().__init__()
         self.files = files
+        self.file_sizes = file_sizes
         self.hashes = {}
         self.canceled = False
 
@@ -44,22 +78,98 @@ class FileHashWorker(QThread):
 
     def run(self):
         """Calculate hashes for all files with progress reporting"""
-        total = len(self.files)
-        for i, file in enumerate(self.files):
-            # Check if canceled
+        def hash_file(file):
             if self.canceled:
-                self.finished.emit({})
-                return
+                return None  # Skip files still queued after a cancel
+            return _hash_file(file)
+
+        # Largest files are started first so the pool doesn't end with one big
+        # file hashing alone while the other workers sit idle
+        files = self.files
+        if self.file_sizes:
+            files = sorted(files, key=lambda file: self.file_sizes.get(file) or 0, reverse=True)
+
+        # Several files are hashed at once so their reads overlap; results are
+        # still collected (and progress reported) in submission order
+        total = len(files)
+        last_progress = -1
+        workers = max(1, min(MAX_HASH_WORKERS, total))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for i, (file, file_hash) in enumerate(zip(files, pool.map(hash_file, files))):
+                # Check if canceled
+                if self.canceled:
+                    self.finished.emit({})
+                    return
 
-            try:
-                self.hashes[file] = calculate_file_hash(file)
-                self.progress.emit(int((i + 1) / total * 100))
-            except Exception as e:
-                self.hashes[file] = f"ERROR: {e!s}"
+                self.hashes[file] = file_hash
+                progress = (i + 1) * 100 // total
+                if progress != last_progress:
+                    last_progress = progress
+                    self.progress.emit(progress)
 
+        if files is not self.files:
+            # Hand the hashes back in the original file order
+            self.hashes = {file: self.hashes[file] for file in self.files}
         self.finished.emit(self.hashes)
 
 
+class FolderScanWorker(QThread):
+    """
+    Worker thread for recursively listing the files in one or more folders.
+
+    Scanning a large tree on the UI thread freezes the window, so the files are
+    found here and handed over in batches that the UI can add while the scan
+    continues.
+
+    Signals:
+        files_found: Emits a list of (file path, size or None) tuples
+        error: Emits the error message if the scan failed
+        finished: Emits the number of files found, also after an error
+    """
+    files_found = Signal(list)
+    error = Signal(str)
+    finished = Signal(int)
+
+    def __init__(self, folders):
+        """
+        Initialize the folder scan worker.
+
+        Args:
+            folders: List of folders to scan recursively, in order
+        """
+        super().__init__()
+        self.folders = folders
+        self.canceled = False
+
+    def cancel(self):
+        """Cancel the folder scan"""
+        self.canceled = True
+
+    def run(self):
+        """Scan the folders, emitting the files found in batches"""
+        found = 0
+        try:
+            batch = []
+            entries = (entry for folder in self.folders for entry in iter_files_with_sizes(folder))
+            for entry in entries:
+                if self.canceled:
+                    break
+                batch.append(entry)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    found += len(batch)
+                    self.files_found.emit(batch)
+                    batch = []
+
+            if batch and not self.canceled:
+                found += len(batch)
+                self.files_found.emit(batch)
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            # Always sent, the UI closes its progress dialog on it
+            self.finished.emit(found)
+
+
 class FileProcessingWorker(QThread):
     """
     Worker thread for processing files and creating log/request entries.
@@ -93,6 +203,7 @@ class FileProcessingWorker(QThread):
             save_callback: Optional function to call for saving transfer log entry
                           Signature: callback(base_log_dir, formatted_timestamp, file_list_path)
                           If None, no transfer log is created (supports both models)
+                          Its return value (e.g. the log path written) is kept in saved_log_path
         """
         super().__init__()
         self.model = model
@@ -101,6 +212,7 @@ class FileProcessingWorker(QThread):
         self.base_log_dir = base_log_dir
         self.file_list_dir = file_list_dir
         self.save_callback = save_callback
+        self.saved_log_path = None
         self.canceled = False
 
     def cancel(self):
@@ -136,14 +248,10 @@ class FileProcessingWorker(QThread):
 
             # Create the transfer log entry if not canceled and callback provided
             if file_list_path and not self.canceled and self.save_callback:
-                # Format timestamp for CSV
-                ts = self.model.timestamp
-                formatted_timestamp = f"{ts[0:4]}-{ts[4:6]}-{ts[6:8]} {ts[9:11]}:{ts[11:13]}:{ts[13:15]}"
-
                 # Call the model-specific save callback
-                self.save_callback(
+                self.saved_log_path = self.save_callback(
                     self.base_log_dir,
-                    formatted_timestamp,
+                    self.model.formatted_timestamp,
                     file_list_path
                 )
 
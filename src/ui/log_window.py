@@ -3,11 +3,9 @@ import datetime
 import getpass
 import os
 import socket
-import subprocess
-import sys
 
-from PySide6.QtCore import QDate, Qt
-from PySide6.QtGui import QAction
+from PySide6.QtCore import QDate, Qt, QUrl
+from PySide6.QtGui import QAction, QDesktopServices
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -29,9 +27,16 @@ from PySide6.QtWidgets import (
 
 from constants import TRANSFER_LOG_HEADERS
 from models.log_model import TransferLog
-from ui.common_workers import FileHashWorker, FileProcessingWorker
-from ui.widgets import DragDropFileListWidget
-from utils.file_utils import get_all_files, get_file_size_str
+from ui.common_workers import (
+    INLINE_HASH_MAX_BYTES,
+    INLINE_HASH_MAX_FILES,
+    FileHashWorker,
+    FileProcessingWorker,
+    FolderScanWorker,
+    hash_files,
+)
+from ui.widgets import DragDropFileListWidget, dismiss_progress_dialog
+from utils.file_utils import append_csv_row, fsync_enabled, get_file_size_str
 
 
 class FileTransferLoggerTab(QWidget):
@@ -50,7 +55,22 @@ class FileTransferLoggerTab(QWidget):
         # Initialize variables
         self.selected_files = []
         self.normalized_paths = set()
+        # Selected path -> (normalized path, size), recorded when the file is added
+        self.file_details = {}
         self.total_size = 0
+        # (transfer log, log dir, file list dir) waiting on the hash worker
+        self._pending_transfer = None
+        # Workers and progress dialogs of the log being generated
+        self.hash_worker = None
+        self.file_worker = None
+        self.progress_dialog = None
+        self.file_progress_dialog = None
+        # Folder scan in progress and the number of files it has added so far
+        self.scan_worker = None
+        self.scan_progress_dialog = None
+        self.scan_added_count = 0
+        # Error message from the folder scan, if it failed
+        self.scan_error = None
 
         # Set up the UI
         self._setup_ui()
@@ -315,30 +335,60 @@ class FileTransferLoggerTab(QWidget):
 
         return actions
 
-    def _add_file(self, file_path):
-        """Add a file if it's not already in the selection"""
+    def _add_files(self, entries):
+        """Add (file path, size or None) pairs, updating the file list once
+
+        Returns:
+            int: Number of files added
+        """
+        new_paths = []
+        for file_path, file_size in entries:
+            display_path = self._track_file(file_path, file_size)
+            if display_path is not None:
+                new_paths.append(display_path)
+
+        if new_paths:
+            # One insert and repaint instead of one per file
+            self.file_list.setUpdatesEnabled(False)
+            try:
+                self.file_list.addItems(new_paths)
+            finally:
+                self.file_list.setUpdatesEnabled(True)
+        return len(new_paths)
+
+    def _track_file(self, file_path, file_size=None):
+        """Record a file in the selection without touching the list widget
+
+        file_size can be passed when the caller already has it (e.g. from a folder scan)
+        to avoid statting the file again.
+
+        Returns:
+            str: Path to display for the file, or None if it was not added
+        """
         try:
             # Always work with absolute, OS-normalized paths for consistency/display
-            abs_display_path = os.path.normpath(os.path.abspath(file_path))
-            normalized_path = self._normalize_path(file_path)
+            # (abspath already normalizes the path, so only the case folding is left for the key)
+            abs_display_path = os.path.abspath(file_path)
+            normalized_path = os.path.normcase(abs_display_path)
             if normalized_path not in self.normalized_paths:
-                try:
-                    file_size = os.path.getsize(abs_display_path)
-                    self.total_size += file_size
-                except OSError:
-                    # Handle files with access issues gracefully
-                    pass
-
-                # Store and display the normalized absolute path
+                if file_size is None:
+                    try:
+                        file_size = os.path.getsize(abs_display_path)
+                    except OSError:
+                        # Handle files with access issues gracefully
+                        file_size = 0
+                self.total_size += file_size
+
+                # Store the normalized absolute path
                 self.selected_files.append(abs_display_path)
                 self.normalized_paths.add(normalized_path)
-                self.file_list.addItem(abs_display_path)
-                return True
-            return False
+                self.file_details[abs_display_path] = (normalized_path, file_size)
+                return abs_display_path
+            return None
         except Exception as e:
             self.app.set_status_message(
                 f"Error adding file {file_path}: {e!s}")
-            return False
+            return None
 
     def _add_combo_field(self, layout, label_text, options):
         field_layout = QHBoxLayout()
@@ -401,21 +451,17 @@ class FileTransferLoggerTab(QWidget):
 
     def _normalize_path(self, path):
         """Normalize a path for consistent comparisons"""
-        # Convert to absolute path and normalize slashes
-        return os.path.normcase(os.path.normpath(os.path.abspath(path)))
+        # Convert to absolute path (abspath also normalizes slashes and ..)
+        return os.path.normcase(os.path.abspath(path))
 
     def open_file(self, file_path):
         """Open a file with the default application in a platform-independent way"""
+        if not file_path:
+            return
         if os.path.exists(file_path):
-            try:
-                if sys.platform == 'win32':
-                    os.startfile(file_path)
-                elif sys.platform == 'darwin':  # macOS
-                    subprocess.call(['open', file_path])
-                else:  # Linux and other Unix-like
-                    subprocess.call(['xdg-open', file_path])
-            except Exception as e:
-                self.app.set_status_message(f"Error opening file: {e!s}")
+            # Qt hands the file to the desktop's default handler without waiting on it
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(file_path)):
+                self.app.set_status_message(f"Error opening file: {file_path}")
 
     def _update_file_stats(self):
         """Update the file count and size display"""
@@ -428,10 +474,7 @@ class FileTransferLoggerTab(QWidget):
         self.app.set_status_message("Selecting files...")
         files, _ = QFileDialog.getOpenFileNames(self, "Select Files")
 
-        added_count = 0
-        for file in files:
-            if self._add_file(file):
-                added_count += 1
+        added_count = self._add_files((file, None) for file in files)
 
         self._update_file_stats()
         self.app.set_status_message(f"Added {added_count} files")
@@ -439,31 +482,56 @@ class FileTransferLoggerTab(QWidget):
     def select_folders(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder")
         if folder:
-            self.app.set_status_message(f"Scanning folder: {folder}")
-
-            # Show progress dialog while scanning
-            progress = QProgressDialog(
-                "Scanning folder...", "Cancel", 0, 0, self)
-            progress.setWindowTitle("Scanning Folder")
-            progress.setWindowModality(Qt.WindowModality.WindowModal)
-            progress.show()
+            self._scan_folders([folder])
+
+    def _scan_folders(self, folders):
+        """Add the files in folders from a worker thread, showing a progress dialog"""
+        self.app.set_status_message(f"Scanning folder: {', '.join(folders)}")
+
+        # Show progress dialog while scanning
+        self.scan_progress_dialog = QProgressDialog(
+            "Scanning folder...", "Cancel", 0, 0, self)
+        self.scan_progress_dialog.setWindowTitle("Scanning Folder")
+        self.scan_progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.scan_progress_dialog.show()
+
+        # Scan in a worker thread, adding files as they are found
+        self.scan_added_count = 0
+        self.scan_error = None
+        self.scan_worker = FolderScanWorker(folders)
+        self.scan_worker.files_found.connect(self._on_folder_files_found)
+        self.scan_worker.error.connect(self._on_folder_scan_error)
+        self.scan_worker.finished.connect(self._on_folder_scan_finished)
+        self.scan_progress_dialog.canceled.connect(self.scan_worker.cancel)
+        self.scan_worker.start()
+
+    def _on_folder_files_found(self, entries):
+        """Add a batch of (file path, size) tuples found by the folder scan"""
+        self.scan_added_count += self._add_files(entries)
+        self._update_file_stats()
 
-            try:
-                files = get_all_files(folder)
-                added_count = 0
-                for file in files:
-                    if self._add_file(file):
-                        added_count += 1
-
-                self._update_file_stats()
-                self.app.set_status_message(
-                    f"Added {added_count} files from folder")
-            finally:
-                progress.close()
+    def _on_folder_scan_error(self, message):
+        """Keep the folder scan's error to report once the scan has finished"""
+        self.scan_error = message
+
+    def _on_folder_scan_finished(self, found_count):
+        """Close the scan progress dialog and report the result"""
+        dismiss_progress_dialog(self.scan_progress_dialog)
+        self.scan_progress_dialog = None
+        if self.scan_error is not None:
+            QMessageBox.warning(self, "Error", f"Error scanning folder: {self.scan_error}")
+            self.app.set_status_message("Error scanning folder")
+        elif self.scan_worker.canceled:
+            self.app.set_status_message(
+                f"Folder scan canceled - added {self.scan_added_count} of {found_count} files found")
+        else:
+            self.app.set_status_message(
+                f"Added {self.scan_added_count} of {found_count} files found in folder")
 
     def clear_selected_files(self):
         self.selected_files.clear()
         self.normalized_paths.clear()
+        self.file_details.clear()
         self.file_list.clear()
         self.total_size = 0
         self._update_file_stats()
@@ -474,49 +542,51 @@ class FileTransferLoggerTab(QWidget):
         if not selected_items:
             return
 
-        for item in selected_items:
-            file_path = item.text()
-            if file_path in self.selected_files:
-                try:
-                    self.total_size -= os.path.getsize(file_path)
-                except (OSError, ValueError):
-                    pass
-                self.selected_files.remove(file_path)
-                self.normalized_paths.remove(self._normalize_path(file_path))
-                row = self.file_list.row(item)
-                self.file_list.takeItem(row)
+        self._remove_files([item.text() for item in selected_items])
 
         self._update_file_stats()
         self.app.set_status_message(f"Removed {len(selected_items)} items")
 
     def _remove_files_not_in_request(self, files_to_remove):
         """Remove specific files from the selection by file path"""
-        removed_count = 0
-
-        for file_path in files_to_remove:
-            if file_path in self.selected_files:
-                try:
-                    # Update total size
-                    self.total_size -= os.path.getsize(file_path)
-                except OSError:
-                    pass  # File may have been deleted or is inaccessible
-
-                # Remove from internal lists
-                self.selected_files.remove(file_path)
-                self.normalized_paths.remove(self._normalize_path(file_path))
-
-                # Remove from UI list
-                for i in range(self.file_list.count()):
-                    item = self.file_list.item(i)
-                    if item and item.text() == file_path:
-                        self.file_list.takeItem(i)
-                        removed_count += 1
-                        break
+        removed_count = self._remove_files(files_to_remove)
 
         # Update file statistics
         self._update_file_stats()
         return removed_count
 
+    def _remove_files(self, file_paths):
+        """Remove files (as stored in selected_files) from the selection and the list
+
+        The list widget rows match selected_files, so the rows to drop are found in
+        one pass and both are compacted once, rather than searching per file.
+
+        Returns:
+            int: Number of files removed
+        """
+        to_remove = set()
+        for file_path in file_paths:
+            details = self.file_details.pop(file_path, None)
+            if details is not None:
+                normalized_path, file_size = details
+                # Update total size with the size recorded when the file was added
+                self.total_size -= file_size
+                self.normalized_paths.discard(normalized_path)
+                to_remove.add(file_path)
+
+        if to_remove:
+            rows = [row for row, file_path in enumerate(self.selected_files) if file_path in to_remove]
+            self.selected_files[:] = [file_path for file_path in self.selected_files if file_path not in to_remove]
+
+            # Remove from UI list, last row first so earlier rows keep their index
+            self.file_list.setUpdatesEnabled(False)
+            try:
+                for row in reversed(rows):
+                    self.file_list.takeItem(row)
+            finally:
+                self.file_list.setUpdatesEnabled(True)
+        return len(to_remove)
+
     def import_request_file(self):
         """Import files from a request CSV file or plain text file list"""
         # Get the default request folder from config
@@ -582,7 +652,7 @@ class FileTransferLoggerTab(QWidget):
                 # Find existing files not in the request
                 existing_not_in_request = []
                 for existing_file in self.selected_files:
-                    normalized_existing_path = self._normalize_path(existing_file)
+                    normalized_existing_path = self.file_details[existing_file][0]
                     if normalized_existing_path not in request_file_paths:
                         existing_not_in_request.append(existing_file)
 
@@ -653,17 +723,18 @@ class FileTransferLoggerTab(QWidget):
                     # If keep_all_btn, just continue with import (no action needed)
 
             # Import files from the request
-            added_count = 0
+            found_files = []
             missing_files = []
 
             for file_path_entry in file_list:
                 file_path = file_path_entry.get('FullName', '')
                 if file_path and os.path.exists(file_path):
-                    if self._add_file(file_path):
-                        added_count += 1
+                    found_files.append((file_path, None))
                 else:
                     missing_files.append(file_path)
 
+            added_count = self._add_files(found_files)
+
             # Update file statistics
             self._update_file_stats()
 
@@ -904,6 +975,12 @@ class FileTransferLoggerTab(QWidget):
         )
 
         if self.include_sha256_check.isChecked():
+            if self.total_size <= INLINE_HASH_MAX_BYTES and len(self.selected_files) <= INLINE_HASH_MAX_FILES:
+                # Too little data to be worth a worker thread and progress dialog
+                self.start_file_processing(
+                    transfer_log, hash_files(self.selected_files), base_log_dir, file_list_dir)
+                return
+
             # Show progress dialog for checksums
             self.progress_dialog = QProgressDialog(
                 "Calculating checksums...", "Cancel", 0, 100, self)
@@ -913,22 +990,27 @@ class FileTransferLoggerTab(QWidget):
             self.progress_dialog.canceled.connect(self.cancel_hash_operation)
             self.progress_dialog.show()
 
-            # Create worker thread for checksums
-            self.hash_worker = FileHashWorker(self.selected_files)
+            # Create worker thread for checksums; the log details wait here for its result
+            self._pending_transfer = (transfer_log, base_log_dir, file_list_dir)
+            self.hash_worker = FileHashWorker(
+                self.selected_files, {path: size for path, (_, size) in self.file_details.items()})
             self.hash_worker.progress.connect(self.progress_dialog.setValue)
-            self.hash_worker.finished.connect(
-                lambda hashes: self.start_file_processing(
-                    transfer_log, hashes, base_log_dir, file_list_dir)
-                if hashes else None
-            )
+            self.hash_worker.finished.connect(self._on_hashes_ready)
             self.hash_worker.start()
         else:
             # Skip checksums and proceed directly to file processing
             self.start_file_processing(transfer_log, {}, base_log_dir, file_list_dir)
 
+    def _on_hashes_ready(self, hashes):
+        """Continue the pending transfer log once its checksums are calculated"""
+        pending, self._pending_transfer = self._pending_transfer, None
+        if hashes and pending:  # Empty when the hashing was canceled
+            transfer_log, base_log_dir, file_list_dir = pending
+            self.start_file_processing(transfer_log, hashes, base_log_dir, file_list_dir)
+
     def start_file_processing(self, transfer_log, hashes, base_log_dir, file_list_dir):
-        if hasattr(self, 'progress_dialog'):
-            self.progress_dialog.close()
+        dismiss_progress_dialog(self.progress_dialog)
+        self.progress_dialog = None
 
         # Show progress dialog for file processing
         self.file_progress_dialog = QProgressDialog(
@@ -942,8 +1024,7 @@ class FileTransferLoggerTab(QWidget):
 
         # Create callback for saving transfer log
         def save_transfer_log(base_dir, formatted_timestamp, file_list_path):
-            year = datetime.datetime.now().strftime("%Y")
-            csv_file = os.path.join(base_dir, f"TransferLog_{year}.log")
+            csv_file = self._yearly_log_path(base_dir)
 
             # Format transfer data for CSV
             fields = [
@@ -962,33 +1043,30 @@ class FileTransferLoggerTab(QWidget):
                 file_list_path
             ]
 
-            # Write the log entry to the CSV file
-            file_exists = os.path.isfile(csv_file)
-            with open(csv_file, 'a', newline='') as f:
-                writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-
-                # Write headers if file is new
-                if not file_exists:
-                    writer.writerow(TRANSFER_LOG_HEADERS)
-
-                writer.writerow(fields)
+            # Write the log entry to the CSV file (headers first if the file is new)
+            append_csv_row(csv_file, fields, TRANSFER_LOG_HEADERS, sync=fsync_enabled(self.config))
+            return csv_file
 
         # Create worker thread for file processing
         self.file_worker = FileProcessingWorker(
             transfer_log, self.selected_files, hashes, base_log_dir, file_list_dir,
             save_callback=save_transfer_log)
         self.file_worker.progress.connect(self.file_progress_dialog.setValue)
-        self.file_worker.finished.connect(lambda file_path: self.complete_log_save(
-            transfer_log, file_path))
+        self.file_worker.finished.connect(self.complete_log_save)
         self.file_worker.start()
 
-    def complete_log_save(self, transfer_log, file_path):
-        # Close progress dialog
-        if hasattr(self, 'file_progress_dialog'):
-            self.file_progress_dialog.close()
+    @staticmethod
+    def _yearly_log_path(base_dir):
+        """Get the path of this year's transfer log in base_dir"""
+        return os.path.join(base_dir, f"TransferLog_{datetime.date.today().year}.log")
+
+    def complete_log_save(self, file_path):
+        # Close progress dialog (already gone if the user canceled)
+        dismiss_progress_dialog(self.file_progress_dialog)
+        self.file_progress_dialog = None
 
         # Check if this was a cancellation
-        if not file_path and hasattr(self, 'file_worker') and self.file_worker.canceled:
+        if not file_path and self.file_worker is not None and self.file_worker.canceled:
             self.app.set_status_message("Log generation cancelled by user")
             return
 
@@ -1001,41 +1079,43 @@ class FileTransferLoggerTab(QWidget):
                 "File list saved as CSV."
             )
 
-            # Success status bar
+            # Success status bar, counting the files recorded in the saved log
             self.app.set_status_message(
-                f"Logs generated successfully - {len(self.selected_files)} files processed")
+                f"Logs generated successfully - {self.file_worker.model.file_count} files processed")
 
             # Open log files if requested
             if self.open_file_list_log_check.isChecked():
                 self.open_file(file_path)
 
-            if self.open_transfer_log_check.isChecked():
-                year = datetime.datetime.now().strftime("%Y")
-                yearly_log = os.path.join(self.log_folder_edit.text(), f"TransferLog_{year}.log")
-                self.open_file(yearly_log)
+            # The log the worker just appended to, even if the folder field changed since
+            # (None if the save callback did not run, e.g. canceled at the last moment)
+            if self.open_transfer_log_check.isChecked() and self.file_worker.saved_log_path:
+                self.open_file(self.file_worker.saved_log_path)
         else:
             QMessageBox.critical(self, "Error", "Failed to save log file")
             self.app.set_status_message("Error: Failed to save log file")
 
     def cancel_hash_operation(self):
         """Cancel the hash calculation operation and entire logging process"""
-        if hasattr(self, 'hash_worker'):
+        # The worker stops before its next file; a repeated cancel has nothing to add
+        if self.hash_worker is not None and not self.hash_worker.canceled:
             self.hash_worker.cancel()
             self.app.set_status_message("Log generation canceled by user")
 
         # Close the progress dialog if it's open
-        if hasattr(self, 'progress_dialog'):
-            self.progress_dialog.close()
+        dismiss_progress_dialog(self.progress_dialog)
+        self.progress_dialog = None
 
     def cancel_file_processing(self):
         """Cancel the file processing operation"""
-        if hasattr(self, 'file_worker'):
+        # The worker stops at its next check; a repeated cancel has nothing to add
+        if self.file_worker is not None and not self.file_worker.canceled:
             self.file_worker.cancel()
             self.app.set_status_message("File processing canceled by user")
 
         # Close the progress dialog if it's open
-        if hasattr(self, 'file_progress_dialog'):
-            self.file_progress_dialog.close()
+        dismiss_progress_dialog(self.file_progress_dialog)
+        self.file_progress_dialog = None
 
     def reload_configuration(self):
         """Reload configuration from file"""
@@ -2,11 +2,9 @@ import datetime
 import getpass
 import os
 import socket
-import subprocess
-import sys
 
-from PySide6.QtCore import QDate, Qt
-from PySide6.QtGui import QAction
+from PySide6.QtCore import QDate, Qt, QUrl
+from PySide6.QtGui import QAction, QDesktopServices
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -26,9 +24,16 @@ from PySide6.QtWidgets import (
 )
 
 from models.request_model import RequestLog
-from ui.common_workers import FileHashWorker, FileProcessingWorker
-from ui.widgets import DragDropFileListWidget
-from utils.file_utils import get_all_files, get_file_size_str
+from ui.common_workers import (
+    INLINE_HASH_MAX_BYTES,
+    INLINE_HASH_MAX_FILES,
+    FileHashWorker,
+    FileProcessingWorker,
+    FolderScanWorker,
+    hash_files,
+)
+from ui.widgets import DragDropFileListWidget, dismiss_progress_dialog
+from utils.file_utils import get_file_size_str
 
 
 class FileTransferRequestTab(QWidget):
@@ -46,7 +51,22 @@ class FileTransferRequestTab(QWidget):
         # Initialize variables
         self.selected_files = []
         self.normalized_paths = set()
+        # Selected path -> (normalized path, size), recorded when the file is added
+        self.file_details = {}
         self.total_size = 0
+        # (request log, request dir, file list dir) waiting on the hash worker
+        self._pending_request = None
+        # Workers and progress dialogs of the request being created
+        self.hash_worker = None
+        self.processing_worker = None
+        self.hash_progress_dialog = None
+        self.processing_progress_dialog = None
+        # Folder scan in progress and the number of files it has added so far
+        self.scan_worker = None
+        self.scan_progress_dialog = None
+        self.scan_added_count = 0
+        # Error message from the folder scan, if it failed
+        self.scan_error = None
 
         # Set up the UI
         self._setup_ui()
@@ -258,10 +278,7 @@ class FileTransferRequestTab(QWidget):
             self, "Select Files to Request", "", "All Files (*)")
 
         if files:
-            added_count = 0
-            for file_path in files:
-                if self._add_file(file_path):
-                    added_count += 1
+            added_count = self._add_files((file_path, None) for file_path in files)
 
             self._update_file_stats()
             if added_count > 0:
@@ -272,23 +289,76 @@ class FileTransferRequestTab(QWidget):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder")
 
         if folder:
-            self.app.set_status_message(f"Scanning folder: {folder}")
+            self._scan_folders([folder])
+
+    def _scan_folders(self, folders):
+        """Add the files in folders from a worker thread, showing a progress dialog"""
+        self.app.set_status_message(f"Scanning folder: {', '.join(folders)}")
+
+        # Show progress dialog while scanning
+        self.scan_progress_dialog = QProgressDialog("Scanning folder...", "Cancel", 0, 0, self)
+        self.scan_progress_dialog.setWindowTitle("Scanning Folder")
+        self.scan_progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.scan_progress_dialog.show()
+
+        # Scan in a worker thread, adding files as they are found
+        self.scan_added_count = 0
+        self.scan_error = None
+        self.scan_worker = FolderScanWorker(folders)
+        self.scan_worker.files_found.connect(self._on_folder_files_found)
+        self.scan_worker.error.connect(self._on_folder_scan_error)
+        self.scan_worker.finished.connect(self._on_folder_scan_finished)
+        self.scan_progress_dialog.canceled.connect(self.scan_worker.cancel)
+        self.scan_worker.start()
+
+    def _on_folder_files_found(self, entries):
+        """Add a batch of (file path, size) tuples found by the folder scan"""
+        self.scan_added_count += self._add_files(entries)
+        self._update_file_stats()
+
+    def _on_folder_scan_error(self, message):
+        """Keep the folder scan's error to report once the scan has finished"""
+        self.scan_error = message
+
+    def _on_folder_scan_finished(self, found_count):
+        """Close the scan progress dialog and report the result"""
+        dismiss_progress_dialog(self.scan_progress_dialog)
+        self.scan_progress_dialog = None
+        if self.scan_error is not None:
+            QMessageBox.warning(self, "Error", f"Error scanning folder: {self.scan_error}")
+            self.app.set_status_message("Error scanning folder")
+        elif self.scan_worker.canceled:
+            self.app.set_status_message(f"Folder scan canceled - added {self.scan_added_count} of {found_count} files found")
+        else:
+            self.app.set_status_message(f"Added {self.scan_added_count} of {found_count} files found in folder")
+
+    def _add_files(self, entries):
+        """Add (file path, size or None) pairs, updating the file list once
 
+        Returns:
+            int: Number of files added
+        """
+        new_paths = [file_path for file_path, file_size in entries if self._track_file(file_path, file_size)]
+
+        if new_paths:
+            # One insert and repaint instead of one per file
+            self.file_list.setUpdatesEnabled(False)
             try:
-                files = get_all_files(folder)
-                added_count = 0
-                for file_path in files:
-                    if self._add_file(file_path):
-                        added_count += 1
-
-                self._update_file_stats()
-                self.app.set_status_message(f"Added {added_count} files from folder")
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Error scanning folder: {e!s}")
-                self.app.set_status_message("Error scanning folder")
-
-    def _add_file(self, file_path):
-        """Add a file to the selected files list"""
+                self.file_list.addItems(new_paths)
+            finally:
+                self.file_list.setUpdatesEnabled(True)
+        return len(new_paths)
+
+    def _track_file(self, file_path, file_size=None):
+        """Record a file in the selection without touching the list widget
+
+        file_size can be passed when the caller already has it, so the file isn't
+        statted again. Callers only pass sizes for regular files (iter_files_with_sizes
+        and the drop handler check this); without a size the path is checked here.
+
+        Returns:
+            bool: True if the file was added
+        """
         try:
             # Normalize the path for comparison
             normalized_path = self._normalize_path(file_path)
@@ -298,21 +368,21 @@ class FileTransferRequestTab(QWidget):
                 return False
 
             # Check if file exists
-            if not os.path.isfile(file_path):
-                return False
+            if file_size is None:
+                try:
+                    if not os.path.isfile(file_path):
+                        return False
+                    file_size = os.path.getsize(file_path)
+                except OSError:
+                    file_size = 0  # Ignore size calculation errors
 
             # Add to lists
             self.selected_files.append(file_path)
             self.normalized_paths.add(normalized_path)
-
-            # Add to UI list
-            self.file_list.addItem(file_path)
+            self.file_details[file_path] = (normalized_path, file_size)
 
             # Update total size
-            try:
-                self.total_size += os.path.getsize(file_path)
-            except OSError:
-                pass  # Ignore size calculation errors
+            self.total_size += file_size
 
             return True
         except Exception as e:
@@ -321,7 +391,8 @@ class FileTransferRequestTab(QWidget):
 
     def _normalize_path(self, path):
         """Normalize a path for consistent comparisons"""
-        return os.path.normpath(os.path.abspath(path)).lower()
+        # abspath already normalizes slashes and .., only the case is folded here
+        return os.path.abspath(path).lower()
 
     def remove_selected_file(self):
         """Remove the selected file from the list"""
@@ -332,16 +403,11 @@ class FileTransferRequestTab(QWidget):
 
             # Remove from data structures
             self.selected_files.pop(current_row)
-            normalized_path = self._normalize_path(file_path)
+            normalized_path, file_size = self.file_details.pop(file_path)
             self.normalized_paths.discard(normalized_path)
 
-            # Update total size
-            try:
-                self.total_size -= os.path.getsize(file_path)
-                if self.total_size < 0:
-                    self.total_size = 0
-            except OSError:
-                pass  # File may have been deleted or is inaccessible
+            # Update total size with the size recorded when the file was added
+            self.total_size -= file_size
 
             # Remove from UI
             self.file_list.takeItem(current_row)
@@ -353,6 +419,7 @@ class FileTransferRequestTab(QWidget):
         """Clear all selected files"""
         self.selected_files.clear()
         self.normalized_paths.clear()
+        self.file_details.clear()
         self.total_size = 0
         self.file_list.clear()
         self._update_file_stats()
@@ -432,36 +499,45 @@ class FileTransferRequestTab(QWidget):
         if not self.selected_files:
             return
 
+        if self.total_size <= INLINE_HASH_MAX_BYTES and len(self.selected_files) <= INLINE_HASH_MAX_FILES:
+            # Too little data to be worth a worker thread and progress dialog
+            self._process_request_files(request_log, hash_files(self.selected_files), base_request_dir, file_list_dir)
+            return
+
         # Show progress dialog
-        progress_dialog = QProgressDialog("Calculating file hashes...", "Cancel", 0, 100, self)
-        progress_dialog.setWindowModality(Qt.WindowModal)
-        progress_dialog.setMinimumDuration(0)
-        progress_dialog.show()
-
-        # Create and start hash worker
-        self.hash_worker = FileHashWorker(self.selected_files)
-        self.hash_worker.progress.connect(progress_dialog.setValue)
-        self.hash_worker.finished.connect(
-            lambda hashes: self._on_hashes_calculated(hashes, request_log, base_request_dir, file_list_dir, progress_dialog)
-            if hashes else None
-        )
-        progress_dialog.canceled.connect(self.hash_worker.cancel)
+        self.hash_progress_dialog = QProgressDialog("Calculating file hashes...", "Cancel", 0, 100, self)
+        self.hash_progress_dialog.setWindowModality(Qt.WindowModal)
+        self.hash_progress_dialog.setMinimumDuration(0)
+        self.hash_progress_dialog.show()
+
+        # Create and start hash worker; the request details wait here for its result
+        self._pending_request = (request_log, base_request_dir, file_list_dir)
+        self.hash_worker = FileHashWorker(
+            self.selected_files, {path: size for path, (_, size) in self.file_details.items()})
+        self.hash_worker.progress.connect(self.hash_progress_dialog.setValue)
+        self.hash_worker.finished.connect(self._on_hashes_calculated)
+        self.hash_progress_dialog.canceled.connect(self.hash_worker.cancel)
 
         self.hash_worker.start()
 
-    def _on_hashes_calculated(self, hashes, request_log, base_request_dir, file_list_dir, progress_dialog):
+    def _on_hashes_calculated(self, hashes):
         """Handle hash calculation completion"""
-        progress_dialog.close()
+        pending, self._pending_request = self._pending_request, None
+        if not hashes or not pending:
+            return  # Hashing was canceled
+        dismiss_progress_dialog(self.hash_progress_dialog)
+        self.hash_progress_dialog = None
         # Now proceed with file processing using the calculated hashes
+        request_log, base_request_dir, file_list_dir = pending
         self._process_request_files(request_log, hashes, base_request_dir, file_list_dir)
 
     def _process_request_files(self, request_log, file_hashes, base_request_dir, file_list_dir):
         """Process the request files and create output"""
         # Show progress dialog
-        progress_dialog = QProgressDialog("Creating request files...", "Cancel", 0, 100, self)
-        progress_dialog.setWindowModality(Qt.WindowModal)
-        progress_dialog.setMinimumDuration(0)
-        progress_dialog.show()
+        self.processing_progress_dialog = QProgressDialog("Creating request files...", "Cancel", 0, 100, self)
+        self.processing_progress_dialog.setWindowModality(Qt.WindowModal)
+        self.processing_progress_dialog.setMinimumDuration(0)
+        self.processing_progress_dialog.show()
 
         # Create callback for saving annual request log (if enabled)
         def save_request_log_callback(base_dir, formatted_timestamp, file_list_path):
@@ -479,9 +555,9 @@ class FileTransferRequestTab(QWidget):
         self.processing_worker = FileProcessingWorker(
             request_log, self.selected_files, file_hashes, base_request_dir, file_list_dir,
             save_callback=save_request_log_callback)
-        self.processing_worker.progress.connect(progress_dialog.setValue)
-        self.processing_worker.finished.connect(lambda path: self._on_request_created(path, progress_dialog))
-        progress_dialog.canceled.connect(self.processing_worker.cancel)
+        self.processing_worker.progress.connect(self.processing_progress_dialog.setValue)
+        self.processing_worker.finished.connect(self._on_request_created)
+        self.processing_progress_dialog.canceled.connect(self.processing_worker.cancel)
 
         self.processing_worker.start()
 
@@ -489,9 +565,10 @@ class FileTransferRequestTab(QWidget):
         while self.processing_worker.isRunning():
             QApplication.processEvents()
 
-    def _on_request_created(self, file_list_path, progress_dialog):
+    def _on_request_created(self, file_list_path):
         """Handle request creation completion"""
-        progress_dialog.close()
+        dismiss_progress_dialog(self.processing_progress_dialog)
+        self.processing_progress_dialog = None
 
         if file_list_path:
             QMessageBox.information(self, "Success",
@@ -499,15 +576,9 @@ class FileTransferRequestTab(QWidget):
 
             # Open the files if requested
             if self.open_request_log_check.isChecked():
-                try:
-                    if sys.platform == 'win32':
-                        os.startfile(file_list_path)
-                    elif sys.platform == 'darwin':  # macOS
-                        subprocess.call(['open', file_list_path])
-                    else:  # Linux and other Unix-like
-                        subprocess.call(['xdg-open', file_list_path])
-                except Exception as e:
-                    self.app.set_status_message(f"Error opening file: {e!s}")
+                # Qt hands the file to the desktop's default handler without waiting on it
+                if not QDesktopServices.openUrl(QUrl.fromLocalFile(file_list_path)):
+                    self.app.set_status_message(f"Error opening file: {file_list_path}")
 
             self.app.set_status_message("Request created successfully")
         else:
@@ -1,19 +1,34 @@
 """Shared UI widgets for the PyDTATransferLog application"""
 
 import os
+import stat
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QDragEnterEvent, QDragMoveEvent, QDropEvent, QPainter, QPen
 from PySide6.QtWidgets import QListWidget
 
-from utils.file_utils import get_all_files
+# Hint drawn in an empty list
+_DROP_HINT_TEXT = "📁➕\n\nDrag and drop files or folders here"  # noqa: RUF001 - intentional UI glyph
+
+
+def dismiss_progress_dialog(dialog):
+    """Close a progress dialog whose work is done
+
+    Closing a QProgressDialog emits canceled, which would otherwise run the
+    cancel handler against a worker that has already finished.
+    """
+    if dialog is not None:
+        dialog.canceled.disconnect()
+        dialog.close()
 
 
 class DragDropFileListWidget(QListWidget):
     """Reusable file list widget with drag and drop support.
 
     The parent widget must implement:
-    - _add_file(file_path: str) -> bool: Add a file to the list, return True if added
+    - _add_files(entries) -> int: Add (file path, size or None) pairs to the list in one
+      batch, return the number added
+    - _scan_folders(folders): Add the files in folders without blocking the UI
     - _update_file_stats(): Update file statistics display
     - app.set_status_message(message: str): Update status bar message
     """
@@ -26,6 +41,11 @@ class DragDropFileListWidget(QListWidget):
         # Set minimum height to ensure the drop hint is visible
         self.setMinimumHeight(100)
 
+        # Dashed border pen for the drop hint, built once rather than on every repaint
+        self._hint_pen = QPen(Qt.DashLine)
+        self._hint_pen.setColor(Qt.gray)
+        self._hint_pen.setWidth(1)
+
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Accept the drag if it contains file URLs or text"""
         if event.mimeData().hasUrls() or event.mimeData().hasText():
@@ -56,11 +76,7 @@ class DragDropFileListWidget(QListWidget):
 
         for url in urls:
             if url.isLocalFile():
-                file_path = url.toLocalFile()
-                if os.path.isfile(file_path):
-                    files.append(file_path)
-                elif os.path.isdir(file_path):
-                    folders.append(file_path)
+                self._classify_path(url.toLocalFile(), files, folders)
 
         # Process all files and folders
         self._process_files_and_folders(files, folders)
@@ -72,39 +88,35 @@ class DragDropFileListWidget(QListWidget):
         folders = []
 
         for path in paths:
-            path = path.strip()
-            if os.path.isfile(path):
-                files.append(path)
-            elif os.path.isdir(path):
-                folders.append(path)
+            self._classify_path(path.strip(), files, folders)
 
         # Process all files and folders
         self._process_files_and_folders(files, folders)
 
+    @staticmethod
+    def _classify_path(path, files, folders):
+        """Append path to files (with its size) or folders, using a single stat"""
+        try:
+            file_stat = os.stat(path)
+        except (OSError, ValueError):
+            return  # Missing or invalid path
+        if stat.S_ISREG(file_stat.st_mode):
+            files.append((path, file_stat.st_size))
+        elif stat.S_ISDIR(file_stat.st_mode):
+            folders.append(path)
+
     def _process_files_and_folders(self, files, folders):
-        """Process lists of files and folders"""
+        """Process lists of (file path, size) tuples and folders"""
         # Add individual files
-        added_count = 0
-        for file in files:
-            if self.main_window._add_file(file):
-                added_count += 1
-
-        # Process folders
-        for folder in folders:
-            self.main_window.app.set_status_message(f"Scanning folder: {folder}")
-
-            try:
-                folder_files = get_all_files(folder)
-                for file in folder_files:
-                    if self.main_window._add_file(file):
-                        added_count += 1
-            except Exception as e:
-                self.main_window.app.set_status_message(f"Error scanning folder: {e!s}")
+        added_count = self.main_window._add_files(files)
 
         # Update file count
         self.main_window._update_file_stats()
-        self.main_window.app.set_status_message(
-            f"Added {len(files)} files and processed {len(folders)} folders")
+        self.main_window.app.set_status_message(f"Added {added_count} files")
+
+        # Folders are scanned in the background, the scan reports its own result
+        if folders:
+            self.main_window._scan_folders(folders)
 
     def paintEvent(self, event):
         """Override paint event to show drag-drop hint when empty"""
@@ -116,25 +128,13 @@ class DragDropFileListWidget(QListWidget):
             painter.save()
 
             # Draw dashed border
-            pen = QPen(Qt.DashLine)
-            pen.setColor(Qt.gray)
-            pen.setWidth(1)
-            painter.setPen(pen)
+            painter.setPen(self._hint_pen)
             painter.drawRect(5, 5, self.width() - 10, self.height() - 10)
 
-            # Draw text
+            # Draw icon and text
             font = painter.font()
             font.setBold(True)
             painter.setFont(font)
-
-            # Draw icon
-            icon_text = "📁➕"  # noqa: RUF001 - intentional UI glyph
-            text = "Drag and drop files or folders here"
-
-            painter.drawText(
-                self.rect(),
-                Qt.AlignCenter,
-                f"{icon_text}\n\n{text}"
-            )
+            painter.drawText(self.rect(), Qt.AlignCenter, _DROP_HINT_TEXT)
 
             painter.restore()
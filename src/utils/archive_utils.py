@@ -7,9 +7,31 @@ import gzip
 import os
 import tarfile
 import zipfile
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import IO
 
+# Chunk size used when decompressing GZ files only to measure their content
+GZ_READ_CHUNK_SIZE = 1024 * 1024
+
+# Archive kind by normalized extension (see _archive_extension) for top-level files
+_TOP_LEVEL_ARCHIVES = {
+    '.zip': 'zip',
+    '.tar': 'tar', '.tgz': 'tar', '.tar.gz': 'tar', '.tar.bz2': 'tar', '.tar.xz': 'tar',
+    '.gz': 'gz',
+}
+
+# Archive kinds followed inside ZIP and TAR archives
+_NESTED_ARCHIVES = {'.zip': 'zip', '.tar': 'tar', '.tgz': 'tar', '.tar.gz': 'tar'}
+
+
+def _archive_extension(name: str) -> str:
+    """Return the lower-cased extension of name, keeping '.tar' for compressed tars (e.g. '.tar.gz')"""
+    stem, ext = os.path.splitext(name)
+    ext = ext.lower()
+    if ext in ('.gz', '.bz2', '.xz') and stem[-4:].lower() == '.tar':
+        return '.tar' + ext
+    return ext
+
 
 class ArchiveProcessor:
     """Utility class for processing various archive formats"""
@@ -17,7 +39,8 @@ class ArchiveProcessor:
     @staticmethod
     def process_file_with_archives(writer, file_path: str, file_hashes: dict[str, str] | None,
                                  level: int, container_name: str = "",
-                                 hash_calculator: Callable | None = None):
+                                 hash_calculator: Callable | None = None,
+                                 file_size: int | None = None):
         """
         Process a file and its archive contents if applicable.
 
@@ -28,42 +51,66 @@ class ArchiveProcessor:
             level: Current nesting level
             container_name: Name of the containing archive (if any)
             hash_calculator: Optional function to calculate hashes for archive contents
+            file_size: Size of the file if already known (avoids another stat call)
+        """
+        writer.writerows(ArchiveProcessor.iter_rows(file_path, file_hashes, level, container_name,
+                                                    hash_calculator, file_size))
+
+    @staticmethod
+    def iter_rows(file_path: str, file_hashes: dict[str, str] | None,
+                  level: int, container_name: str = "",
+                  hash_calculator: Callable | None = None,
+                  file_size: int | None = None) -> Iterator[list[str]]:
+        """
+        Yield file list rows for a file and its archive contents if applicable.
+
+        Rows are [level, container, full name, size, hash], in the same order
+        process_file_with_archives writes them.
+
+        Args:
+            file_path: Path to the file to process
+            file_hashes: Dictionary of pre-calculated file hashes
+            level: Current nesting level
+            container_name: Name of the containing archive (if any)
+            hash_calculator: Optional function to calculate hashes for archive contents
+            file_size: Size of the file if already known (avoids another stat call)
         """
         try:
             # Get file info
-            file_size = os.path.getsize(file_path)
+            if file_size is None:
+                file_size = os.path.getsize(file_path)
             file_hash = file_hashes.get(file_path, "") if file_hashes else ""
 
-            # Write the main file entry
-            writer.writerow([
+            # Main file entry
+            yield [
                 str(level),             # Level
                 container_name,         # Container
                 file_path,              # FullName (complete path)
                 str(file_size),         # Size
                 file_hash               # File Hash
-            ])
+            ]
 
             # Check if this is an archive file and process its contents
-            file_lower = file_path.lower()
-            if file_lower.endswith('.zip'):
-                ArchiveProcessor._process_zip_file(writer, file_path, level + 1,
-                                                 file_hashes, file_path, hash_calculator)
-            elif file_lower.endswith(('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')):
-                ArchiveProcessor._process_tar_file(writer, file_path, level + 1,
-                                                 file_hashes, file_path, hash_calculator)
-            elif file_lower.endswith('.gz') and not file_lower.endswith('.tar.gz'):
-                ArchiveProcessor._process_gz_file(writer, file_path, level + 1,
-                                                file_hashes, file_path, hash_calculator)
+            kind = _TOP_LEVEL_ARCHIVES.get(_archive_extension(file_path))
+            if kind == 'zip':
+                yield from ArchiveProcessor._iter_zip_rows(file_path, level + 1,
+                                                           file_hashes, file_path, hash_calculator)
+            elif kind == 'tar':
+                yield from ArchiveProcessor._iter_tar_rows(file_path, level + 1,
+                                                           file_hashes, file_path, hash_calculator)
+            elif kind == 'gz':
+                yield from ArchiveProcessor._iter_gz_rows(file_path, level + 1,
+                                                          file_hashes, file_path, hash_calculator)
 
         except Exception as e:
-            # Write error row
-            writer.writerow([
+            # Error row
+            yield [
                 str(level),
                 container_name,
                 file_path,
                 "ERROR",
                 f"ERROR: {e!s}"
-            ])
+            ]
 
     @staticmethod
     def _process_zip_file(writer, zip_path: str | IO[bytes], level: int,
@@ -71,6 +118,15 @@ class ArchiveProcessor:
                          container_name: str | None = None,
                          hash_calculator: Callable | None = None):
         """Process a ZIP file and write its contents to the writer."""
+        writer.writerows(ArchiveProcessor._iter_zip_rows(zip_path, level, file_hashes,
+                                                         container_name, hash_calculator))
+
+    @staticmethod
+    def _iter_zip_rows(zip_path: str | IO[bytes], level: int,
+                       file_hashes: dict[str, str] | None = None,
+                       container_name: str | None = None,
+                       hash_calculator: Callable | None = None) -> Iterator[list[str]]:
+        """Yield rows for the contents of a ZIP file."""
         if file_hashes is None:
             file_hashes = {}
 
@@ -94,28 +150,31 @@ class ArchiveProcessor:
                             except (OSError, ValueError, KeyError):
                                 file_hash = ""  # Skip hash calculation if it fails
 
-                        # Write the file entry
-                        writer.writerow([
+                        # File entry
+                        yield [
                             str(level),
                             current_container,
                             file_info.filename,
                             str(file_info.file_size),
                             file_hash
-                        ])
+                        ]
 
                         # Check if this file is also an archive
-                        if file_info.filename.lower().endswith('.zip'):
+                        kind = _NESTED_ARCHIVES.get(_archive_extension(file_info.filename))
+                        if kind == 'zip':
                             try:
                                 with zip_ref.open(file_info) as inner_file:
-                                    ArchiveProcessor._process_zip_file(writer, inner_file, level + 1,
-                                                                     file_hashes, file_info.filename, hash_calculator)
+                                    yield from ArchiveProcessor._iter_zip_rows(inner_file, level + 1,
+                                                                               file_hashes, file_info.filename,
+                                                                               hash_calculator)
                             except (OSError, ValueError, KeyError):
                                 pass  # Skip nested archives if they can't be processed
-                        elif file_info.filename.lower().endswith(('.tar', '.tar.gz', '.tgz')):
+                        elif kind == 'tar':
                             try:
                                 with zip_ref.open(file_info) as inner_file:
-                                    ArchiveProcessor._process_tar_file(writer, inner_file, level + 1,
-                                                                     file_hashes, file_info.filename, hash_calculator)
+                                    yield from ArchiveProcessor._iter_tar_rows(inner_file, level + 1,
+                                                                               file_hashes, file_info.filename,
+                                                                               hash_calculator)
                             except (OSError, ValueError, KeyError):
                                 pass  # Skip nested archives if they can't be processed
 
@@ -129,6 +188,15 @@ class ArchiveProcessor:
                          container_name: str | None = None,
                          hash_calculator: Callable | None = None):
         """Process a TAR file and write its contents to the writer."""
+        writer.writerows(ArchiveProcessor._iter_tar_rows(tar_path, level, file_hashes,
+                                                         container_name, hash_calculator))
+
+    @staticmethod
+    def _iter_tar_rows(tar_path: str | IO[bytes], level: int,
+                       file_hashes: dict[str, str] | None = None,
+                       container_name: str | None = None,
+                       hash_calculator: Callable | None = None) -> Iterator[list[str]]:
+        """Yield rows for the contents of a TAR file."""
         if file_hashes is None:
             file_hashes = {}
 
@@ -147,7 +215,9 @@ class ArchiveProcessor:
                 tar_ref = tarfile.open(fileobj=tar_path, mode="r:*")
 
             with tar_ref:
-                for member in tar_ref.getmembers():
+                # Iterating reads headers as it goes, so each member is handled while the
+                # archive position is still at its data (no full scan and seek back first)
+                for member in tar_ref:
                     if member.isfile():
                         # Calculate hash if hash_calculator is provided
                         file_hash = ""
@@ -159,30 +229,33 @@ class ArchiveProcessor:
                             except (OSError, ValueError):
                                 file_hash = ""  # Skip hash calculation if it fails
 
-                        # Write the file entry
-                        writer.writerow([
+                        # File entry
+                        yield [
                             str(level),
                             current_container,
                             member.name,
                             str(member.size),
                             file_hash
-                        ])
+                        ]
 
                         # Check if this file is also an archive
-                        if member.name.lower().endswith('.zip'):
+                        kind = _NESTED_ARCHIVES.get(_archive_extension(member.name))
+                        if kind == 'zip':
                             try:
                                 inner_file = tar_ref.extractfile(member)
                                 if inner_file:
-                                    ArchiveProcessor._process_zip_file(writer, inner_file, level + 1,
-                                                                     file_hashes, member.name, hash_calculator)
+                                    yield from ArchiveProcessor._iter_zip_rows(inner_file, level + 1,
+                                                                               file_hashes, member.name,
+                                                                               hash_calculator)
                             except (OSError, ValueError):
                                 pass  # Skip nested archives if they can't be processed
-                        elif member.name.lower().endswith(('.tar', '.tar.gz', '.tgz')):
+                        elif kind == 'tar':
                             try:
                                 inner_file = tar_ref.extractfile(member)
                                 if inner_file:
-                                    ArchiveProcessor._process_tar_file(writer, inner_file, level + 1,
-                                                                     file_hashes, member.name, hash_calculator)
+                                    yield from ArchiveProcessor._iter_tar_rows(inner_file, level + 1,
+                                                                               file_hashes, member.name,
+                                                                               hash_calculator)
                             except (OSError, ValueError):
                                 pass  # Skip nested archives if they can't be processed
 
@@ -196,6 +269,15 @@ class ArchiveProcessor:
                         container_name: str | None = None,
                         hash_calculator: Callable | None = None):
         """Process a GZ file and write its contents to the writer."""
+        writer.writerows(ArchiveProcessor._iter_gz_rows(gz_path, level, file_hashes,
+                                                        container_name, hash_calculator))
+
+    @staticmethod
+    def _iter_gz_rows(gz_path: str | IO[bytes] | bytes, level: int,
+                      file_hashes: dict[str, str] | None = None,
+                      container_name: str | None = None,
+                      hash_calculator: Callable | None = None) -> Iterator[list[str]]:
+        """Yield the row for the contents of a GZ file."""
         if file_hashes is None:
             file_hashes = {}
 
@@ -220,26 +302,34 @@ class ArchiveProcessor:
                 if extracted_name.endswith('.gz'):
                     extracted_name = extracted_name[:-3]
 
-                # Read the content to get size and optionally calculate hash
-                content = gz_ref.read()
-                content_size = len(content)
-
-                # Calculate hash if hash_calculator is provided
                 file_hash = ""
                 if hash_calculator:
+                    # The hash calculator needs the whole decompressed content
+                    content = gz_ref.read()
+                    content_size = len(content)
                     try:
                         file_hash = hash_calculator(content)
                     except (ValueError, TypeError):
                         file_hash = ""  # Skip hash calculation if it fails
+                else:
+                    # Only the size is needed: decompress into a reused buffer
+                    # instead of holding the whole content in memory
+                    buffer = bytearray(GZ_READ_CHUNK_SIZE)
+                    content_size = 0
+                    while True:
+                        count = gz_ref.readinto(buffer)
+                        if not count:
+                            break
+                        content_size += count
 
-                # Write the extracted file entry
-                writer.writerow([
-                    str(level),
-                    current_container,
-                    extracted_name,
-                    str(content_size),
-                    file_hash
-                ])
+            # Extracted file entry
+            yield [
+                str(level),
+                current_container,
+                extracted_name,
+                str(content_size),
+                file_hash
+            ]
 
         except Exception as e:
             # Log error but continue processing
@@ -1,18 +1,12 @@
 import os
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
-from utils.file_utils import calculate_file_hash, get_all_files
+from utils.file_utils import MAX_HASH_WORKERS, calculate_file_hash, get_all_files
+from utils.file_utils import format_timestamp as format_timestamp  # Re-exported for existing callers
 
-
-def format_timestamp(ts: str) -> str:
-    """Format timestamp YYYYMMDD-HHMMSS to YYYY-MM-DD HH:MM:SS"""
-    # Guard against malformed input to avoid producing nonsense strings
-    if not isinstance(ts, str) or len(ts) < 15 or ts[8] != "-":
-        return ts
-    try:
-        return f"{ts[0:4]}-{ts[4:6]}-{ts[6:8]} {ts[9:11]}:{ts[11:13]}:{ts[13:15]}"
-    except (IndexError, TypeError):
-        return ts
+# Percentages at which CLI progress is reported
+PROGRESS_PERCENTAGES = (1, 5, 10, 25, 50, 75, 100)
 
 
 def resolve_output_folder(output_arg: str | None,
@@ -71,18 +65,39 @@ def collect_files(files: list[str],
     return all_files
 
 
+def progress_checkpoints(total: int) -> set[int]:
+    """Return the 1-based item counts at which progress for total items is reported."""
+    return {max(1, total * p // 100) for p in PROGRESS_PERCENTAGES}
+
+
 def compute_hashes(files: list[str],
                    algorithm: str = 'sha256',
                    print_fn: Callable[[str], None] = print,
-                   progress_step: int = 10) -> dict[str, str]:
-    """Compute hashes for files with simple progress printing."""
-    hashes: dict[str, str] = {}
-    total = len(files)
-    for i, file in enumerate(files):
+                   progress_step: int | None = None,
+                   workers: int = MAX_HASH_WORKERS) -> dict[str, str]:
+    """Compute hashes for files with simple progress printing.
+    Files are hashed by up to workers threads; results and progress are still
+    reported in file order.
+    Progress is printed at PROGRESS_PERCENTAGES of the file count, or every
+    progress_step files (and at the end) when progress_step is given.
+    """
+    def hash_file(file: str) -> str:
         try:
-            hashes[file] = calculate_file_hash(file, algorithm=algorithm)
+            return calculate_file_hash(file, algorithm=algorithm)
         except Exception as e:
-            hashes[file] = f"ERROR: {e!s}"
-        if ((i + 1) % progress_step == 0) or (i + 1 == total):
-            print_fn(f"Processed {i + 1}/{total} files")
+            return f"ERROR: {e!s}"
+
+    hashes: dict[str, str] = {}
+    total = len(files)
+    checkpoints = None if progress_step else progress_checkpoints(total)
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, total or 1))) as pool:
+        for i, (file, file_hash) in enumerate(zip(files, pool.map(hash_file, files))):
+            hashes[file] = file_hash
+            count = i + 1
+            if checkpoints is not None:
+                report = count in checkpoints
+            else:
+                report = (count % progress_step == 0) or (count == total)
+            if report:
+                print_fn(f"Processed {count}/{total} files")
     return hashes
@@ -39,6 +39,8 @@ class ConfigManager:
         self.config.read(self.config_path)
         # Cache for transfer types mapping
         self._transfer_types_cache = None
+        # Cache for the set of accepted transfer type names and abbreviations
+        self._valid_transfer_types_cache = None
 
     def _create_default_config(self):
         """Create a default configuration file by copying the bundled config"""
@@ -90,6 +92,19 @@ class ConfigManager:
         self._transfer_types_cache = mapping
         return mapping
 
+    def get_valid_transfer_types(self):
+        """Get the set of accepted transfer types (full names and abbreviations)"""
+        # Use cached value if available
+        if self._valid_transfer_types_cache is not None:
+            return self._valid_transfer_types_cache
+
+        transfer_types = self.get_transfer_types()
+        valid_types = set(transfer_types.keys()) | set(transfer_types.values())
+
+        # Cache the result
+        self._valid_transfer_types_cache = valid_types
+        return valid_types
+
     def get_media_types(self):
         """Get list of media types from the UI section"""
         return self.get_list("UI", "MediaTypes")
@@ -106,6 +121,7 @@ class ConfigManager:
                 self.config = configparser.ConfigParser()
                 self.config.read(self.config_path)
                 self._transfer_types_cache = None
+                self._valid_transfer_types_cache = None
                 return True
             return False
         except Exception as e:
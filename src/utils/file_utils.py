@@ -1,13 +1,31 @@
 import datetime
+import functools
 import getpass
 import hashlib
+import mmap
 import os
 import re
 import socket
 from dataclasses import dataclass
 
+# (divisor, suffix) for human-readable sizes, indexed by (bit_length() - 1) // 10
+_SIZE_UNITS = ((1, "B"), (1024, "KB"), (1024 * 1024, "MB"), (1024 * 1024 * 1024, "GB"))
 
-@dataclass
+# Filename token pattern, e.g. {username} or {date:yyyy-MM-dd}
+_TOKEN_PATTERN = re.compile(r'\{([^}]+)\}')
+
+# Stand-in for the {counter} token while the rest of a template is resolved
+# (NUL cannot appear in a real filename)
+_COUNTER_PLACEHOLDER = "\0counter\0"
+
+# Files at least this large are hashed through a read-only memory map
+_MMAP_HASH_THRESHOLD = 1024 * 1024
+
+# Files hashed concurrently; hashing releases the GIL so reads and digests overlap
+MAX_HASH_WORKERS = min(8, os.cpu_count() or 1)
+
+
+@dataclass(slots=True)
 class FileInfo:
     """Class for tracking file information"""
     path: str
@@ -38,14 +56,7 @@ class FileInfo:
             except (OSError, ValueError):
                 return ""
 
-        if self.size < 1024:
-            return f"{self.size} B"
-        elif self.size < 1024*1024:
-            return f"{self.size/1024:.2f} KB"
-        elif self.size < 1024*1024*1024:
-            return f"{self.size/(1024*1024):.2f} MB"
-        else:
-            return f"{self.size/(1024*1024*1024):.2f} GB"
+        return get_file_size_str(self.size)
 
     @staticmethod
     def get_container_filename(container_path):
@@ -55,6 +66,70 @@ class FileInfo:
         return os.path.basename(container_path)
 
 
+def format_csv_row(fields):
+    """
+    Format a CSV row with every field quoted, as csv.writer(quoting=csv.QUOTE_ALL) would
+
+    Args:
+        fields (list): Field values for the row (None is written as an empty field)
+
+    Returns:
+        str: The quoted row terminated with CRLF (the csv module default)
+    """
+    if not fields:
+        return "\r\n"
+    return '"' + '","'.join([
+        ("" if value is None else str(value)).replace('"', '""') for value in fields
+    ]) + '"\r\n'
+
+
+def fsync_enabled(config):
+    """Return True if the Logging/FsyncOnWrite setting asks for logs to be synced to disk"""
+    if not config:
+        return False
+    return str(config.get("Logging", "FsyncOnWrite", fallback="false")).strip().lower() == "true"
+
+
+def append_csv_row(csv_file, fields, headers=None, sync=False):
+    """
+    Append one row to a CSV log file, writing the headers first if the file is empty
+
+    The headers (when needed) and the row are encoded up front and handed to a
+    single write on an O_APPEND descriptor, so an entry is never interleaved with
+    one appended at the same time by another process.
+
+    Args:
+        csv_file (str): Path to the CSV log file (created if missing)
+        fields (list): Field values for the row
+        headers (list): Column headers written when the file is new (optional)
+        sync (bool): Flush the entry to disk (fsync) before returning
+    """
+    binary = getattr(os, 'O_BINARY', 0)  # Avoid CRT newline translation on Windows
+    fd = os.open(csv_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND | binary, 0o666)
+    try:
+        text = format_csv_row(fields)
+        if headers and os.fstat(fd).st_size == 0:
+            text = format_csv_row(headers) + text
+        data = memoryview(text.encode('utf-8'))
+        while data:
+            data = data[os.write(fd, data):]
+        if sync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def format_timestamp(ts: str) -> str:
+    """Format timestamp YYYYMMDD-HHMMSS to YYYY-MM-DD HH:MM:SS"""
+    # Guard against malformed input to avoid producing nonsense strings
+    if not isinstance(ts, str) or len(ts) < 15 or ts[8] != "-":
+        return ts
+    try:
+        return f"{ts[0:4]}-{ts[4:6]}-{ts[6:8]} {ts[9:11]}:{ts[11:13]}:{ts[13:15]}"
+    except (IndexError, TypeError):
+        return ts
+
+
 def format_display_path(path):
     """
     Format path for CSV display using OS-native separators.
@@ -71,6 +146,28 @@ def format_display_path(path):
         return path
 
 
+@functools.lru_cache(maxsize=1)
+def get_username():
+    """
+    Get the current username (cached, it does not change during a run)
+
+    Returns:
+        str: Login name of the current user
+    """
+    return getpass.getuser()
+
+
+@functools.lru_cache(maxsize=1)
+def get_hostname():
+    """
+    Get the computer's hostname (cached, it does not change during a run)
+
+    Returns:
+        str: Hostname of the current machine
+    """
+    return socket.gethostname()
+
+
 def get_all_files(directory):
     """
     Recursively get all files in a directory
@@ -89,6 +186,72 @@ def get_all_files(directory):
 
     return files
 
+
+def get_all_files_with_sizes(directory):
+    """
+    Recursively get all files in a directory along with their sizes
+
+    Args:
+        directory (str): Directory path to scan
+
+    Returns:
+        list: List of (file path, size in bytes) tuples; size is None if it could not be read
+    """
+    return list(iter_files_with_sizes(directory))
+
+
+def iter_files_with_sizes(directory):
+    """
+    Recursively yield (file path, size) for every regular file in a directory
+
+    Walks the tree in the same order as get_all_files, taking each size from the
+    os.DirEntry seen while scanning so callers don't stat every file again.
+    Only entries for which os.DirEntry.is_file() is true are yielded (as with
+    os.path.isfile, symlinks to files count), so FIFOs, devices, sockets and
+    broken symlinks are left out and callers can trust every path is a file.
+    Files are yielded as they are found, so a caller can act on them (or stop)
+    before a large tree has been scanned completely.
+
+    Args:
+        directory (str): Directory path to scan
+
+    Yields:
+        tuple: (file path, size in bytes); size is None if it could not be read
+    """
+    pending = [directory]
+
+    while pending:
+        root = pending.pop()
+        subdirs = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # Like os.walk, symlinked directories are listed but not followed
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue  # Special file or broken symlink
+                    except OSError:
+                        continue
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        size = None
+                    yield entry.path, size
+        except OSError:
+            continue  # Unreadable directory, skipped as os.walk does
+
+        # Visit subdirectories in listing order after this directory's files
+        pending.extend(reversed(subdirs))
+
+
 def calculate_file_hash(filepath, algorithm='sha256', buffer_size=65536):
     """
     Calculate a file hash using the specified algorithm
@@ -108,11 +271,30 @@ def calculate_file_hash(filepath, algorithm='sha256', buffer_size=65536):
     else:
         raise ValueError(f"Unsupported hash algorithm: {algorithm}")
 
-    with open(filepath, 'rb') as f:
-        buffer = f.read(buffer_size)
-        while len(buffer) > 0:
-            hash_obj.update(buffer)
-            buffer = f.read(buffer_size)
+    with open(filepath, 'rb', buffering=0) as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_HASH_THRESHOLD:
+            try:
+                # Hash straight from the page cache without copying into a read buffer
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    advice = getattr(mmap, 'MADV_SEQUENTIAL', None)
+                    if advice is not None:
+                        mapped.madvise(advice)
+                    hash_obj.update(mapped)
+                return hash_obj.hexdigest()
+            except (OSError, ValueError):
+                pass  # Not mappable (e.g. some network file systems); read it instead
+
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: the read/update loop runs in C and releases the GIL
+            return hashlib.file_digest(f, lambda: hash_obj).hexdigest()
+
+        buffer = bytearray(buffer_size)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hash_obj.update(view[:size])
 
     return hash_obj.hexdigest()
 
@@ -138,12 +320,11 @@ def get_file_size_str(size_bytes):
     """
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024*1024:
-        return f"{size_bytes/1024:.2f} KB"
-    elif size_bytes < 1024*1024*1024:
-        return f"{size_bytes/(1024*1024):.2f} MB"
-    else:
-        return f"{size_bytes/(1024*1024*1024):.2f} GB"
+
+    # Each unit covers 10 more bits; anything past GB stays in GB
+    unit = min(3, (int(size_bytes).bit_length() - 1) // 10)
+    divisor, suffix = _SIZE_UNITS[unit]
+    return f"{size_bytes/divisor:.2f} {suffix}"
 
 def is_valid_file(filepath):
     """
@@ -157,30 +338,31 @@ def is_valid_file(filepath):
     """
     return os.path.isfile(filepath) and os.access(filepath, os.R_OK)
 
-def format_filename(template, data=None, config=None, counter=1):
+def compile_filename(template, data=None, config=None):
     """
-    Format a filename template by replacing tokens with their values.
+    Resolve every filename template token except {counter} once.
 
     Args:
         template: The filename template with tokens like {date}, {username}, etc.
         data: Dictionary with additional data values
         config: Config object for accessing configuration values
-        counter: Counter value for the {counter} token
 
     Returns:
-        The formatted filename with all tokens replaced
+        A function taking a counter value and returning the formatted filename,
+        so trying successive counters does not redo the token replacement
     """
     if not data:
         data = {}
 
     # Base replacements (always available)
     now = datetime.datetime.now()
+    timestamp = now.strftime("%Y%m%d-%H%M%S")
     replacements = {
-        'username': getpass.getuser(),
-        'computername': socket.gethostname(),
-        'counter': str(counter).zfill(3),
-        'year': now.strftime("%Y"),
-        'timestamp': now.strftime("%Y%m%d-%H%M%S")
+        'username': get_username(),
+        'computername': get_hostname(),
+        'counter': _COUNTER_PLACEHOLDER,
+        'year': timestamp[:4],
+        'timestamp': timestamp
     }
 
     # Determine transfer directionality
@@ -228,27 +410,58 @@ def format_filename(template, data=None, config=None, counter=1):
             return replacements.get(token, match.group(0))
 
     # Replace tokens in the template
-    result = re.sub(r'\{([^}]+)\}', replace_token, template)
+    result = _TOKEN_PATTERN.sub(replace_token, template)
 
-    # Make sure the filename is valid
-    result = sanitize_filename(result)
+    if _COUNTER_PLACEHOLDER not in result:
+        # No counter token, the filename is the same for every counter value
+        fixed = sanitize_filename(result)
+        return lambda counter=1: fixed
 
-    return result
+    # Counter digits are always valid, so invalid characters are replaced once up front;
+    # only the length limit depends on the counter value
+    result = _replace_invalid_chars(result)
+
+    def with_counter(counter=1):
+        return _limit_filename_length(result.replace(_COUNTER_PLACEHOLDER, str(counter).zfill(3)))
+
+    return with_counter
+
+
+def format_filename(template, data=None, config=None, counter=1):
+    """
+    Format a filename template by replacing tokens with their values.
+
+    Args:
+        template: The filename template with tokens like {date}, {username}, etc.
+        data: Dictionary with additional data values
+        config: Config object for accessing configuration values
+        counter: Counter value for the {counter} token
+
+    Returns:
+        The formatted filename with all tokens replaced
+    """
+    return compile_filename(template, data, config)(counter)
 
 
 def sanitize_filename(filename):
     """
     Sanitize a filename to ensure it's valid on the current platform
     """
-    # Replace invalid characters
+    return _limit_filename_length(_replace_invalid_chars(filename))
+
+
+def _replace_invalid_chars(filename):
+    """Replace characters that are invalid in Windows filenames with underscores"""
     invalid_chars = '<>:"/\\|?*'
     for char in invalid_chars:
         filename = filename.replace(char, '_')
+    return filename
 
-    # Ensure filename isn't too long
+
+def _limit_filename_length(filename):
+    """Truncate a filename (keeping its extension) so it isn't too long"""
     max_length = 240  # Windows MAX_PATH is 260, leave room for path
     if len(filename) > max_length:
         name, ext = os.path.splitext(filename)
         filename = name[:max_length-len(ext)] + ext
-
     return filename
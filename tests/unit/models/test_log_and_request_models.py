@@ -96,3 +96,85 @@ def test_request_log_writes_file_list_and_log(tmp_path):
     assert rows[0][0] == "Timestamp"
     assert rows[1][2] == "Requester"
     assert file_list_path in rows[1]
+
+
+def test_request_log_appends_without_repeating_headers(tmp_path):
+    request_log = RequestLog(
+        config=DummyConfig(),
+        timestamp="20250101-020304",
+        request_date="01/02/2025",
+        requestor="Requester",
+        computer_name="HOST",
+        purpose="Testing",
+    )
+
+    request_csv = tmp_path / "RequestLog.csv"
+    request_log._save_request_log(str(request_csv), "2025-01-02 02:03:04", "first.csv")
+    request_log._save_request_log(str(request_csv), "2025-01-02 02:03:05", "second.csv")
+
+    with request_csv.open() as f:
+        rows = list(csv.reader(f))
+    assert [row[0] for row in rows] == ["Timestamp", "2025-01-02 02:03:04", "2025-01-02 02:03:05"]
+
+
+def test_transfer_log_reads_templates_once(tmp_path):
+    lookups = []
+
+    class CountingConfig(DummyConfig):
+        def get(self, section, option, fallback=None):
+            lookups.append(option)
+            return fallback
+
+    transfer = TransferLog(
+        config=CountingConfig(),
+        timestamp="20250101-010203",
+        transfer_date="01/01/2025",
+        username="tester",
+        computer_name="HOST",
+        media_type="Flash",
+        media_id="ID123",
+        transfer_type="L2H",
+        source="A",
+        destination="B",
+    )
+
+    sample_file = tmp_path / "file.txt"
+    sample_file.write_text("data")
+    transfer.save(str(tmp_path), [str(sample_file)])
+    transfer.save(str(tmp_path), [str(sample_file)])
+
+    assert lookups.count("TransferLogName") == 1
+    assert lookups.count("FileListName") == 1
+
+
+def test_formatted_timestamp_follows_timestamp():
+    model = BaseLogModel(DummyConfig(), "20250102-030405", "HOST")
+
+    assert model.formatted_timestamp == "2025-01-02 03:04:05"
+    model.timestamp = "20251231-235958"
+    assert model.formatted_timestamp == "2025-12-31 23:59:58"
+
+
+def test_request_log_reads_template_once(tmp_path):
+    lookups = []
+
+    class CountingConfig(DummyConfig):
+        def get(self, section, option, fallback=None):
+            lookups.append((section, option))
+            return fallback
+
+    request_log = RequestLog(
+        config=CountingConfig(),
+        timestamp="20250101-020304",
+        request_date="01/02/2025",
+        requestor="Requester",
+        computer_name="HOST",
+        purpose="Testing",
+    )
+
+    sample_file = tmp_path / "req.txt"
+    sample_file.write_text("request data")
+    for _ in range(2):
+        request_log._save_file_list_with_progress(str(tmp_path), [str(sample_file)], {}, None, lambda: False)
+
+    assert lookups.count(("Requests", "FileListName")) == 1
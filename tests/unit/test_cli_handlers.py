@@ -45,6 +45,10 @@ class DummyConfig(SimpleNamespace):
     def get_transfer_types(self):
         return {"Low to High": "L2H", "High to High": "H2H", "High to Low": "H2L"}
 
+    def get_valid_transfer_types(self):
+        transfer_types = self.get_transfer_types()
+        return set(transfer_types.keys()) | set(transfer_types.values())
+
 
 def _patch_config(dummy=None):  # helper to keep patches consistent
     if dummy is None:
@@ -53,6 +57,7 @@ def _patch_config(dummy=None):  # helper to keep patches consistent
         handlers.ConfigManager,
         __init__=lambda self, path: None,
         get_transfer_types=lambda self: dummy.get_transfer_types(),
+        get_valid_transfer_types=lambda self: dummy.get_valid_transfer_types(),
         get=lambda self, section, option, fallback=None: dummy.get(section, option, fallback),
     )
 
@@ -151,8 +156,8 @@ def test_run_cli_generates_file_list_and_log(tmp_path, capsys):
     with patch.object(sys, "argv", argv), _patch_config(), _freeze_datetime(fixed_now), \
         patch("cli.handlers.collect_files", return_value=[str(data_file)]), \
         patch.object(handlers.TransferLog, "_save_file_list", side_effect=fake_save), \
-        patch("cli.handlers.getpass.getuser", return_value="tester"), \
-        patch("cli.handlers.socket.gethostname", return_value="CLI-HOST"):
+        patch("cli.handlers.get_username", return_value="tester"), \
+        patch("cli.handlers.get_hostname", return_value="CLI-HOST"):
         handlers.run_cli()
 
     captured = capsys.readouterr()
@@ -188,8 +193,8 @@ def test_run_request_cli_creates_request_log_with_hashes(tmp_path, capsys):
         dest_path = Path(dest_dir)
         dest_path.mkdir(parents=True, exist_ok=True)
         if progress_signal is not None:
-            progress_signal.emit(10)
-            progress_signal.emit(100)
+            progress_signal(10)
+            progress_signal(100)
         target = dest_path / "request_file.csv"
         target.write_text("\n".join(files), encoding="utf-8")
         file_list_locations.append(str(target))
@@ -4,7 +4,7 @@ import os
 import tarfile
 import zipfile
 import gzip
-from utils.archive_utils import ArchiveProcessor
+from utils.archive_utils import ArchiveProcessor, _archive_extension
 
 
 def test_process_zip_includes_nested_files(tmp_path):
@@ -170,3 +170,60 @@ def test_process_gz_file_like_with_hash():
     assert rows[0][1] == "sample.gz"
     assert rows[0][2] == "sample"
     assert rows[0][4].startswith("HASH-")
+
+
+def test_process_file_with_archives_uses_known_size(tmp_path, monkeypatch):
+    plain = tmp_path / "plain.txt"
+    plain.write_text("abc")
+
+    def no_stat(_path):
+        raise AssertionError("size should not be re-read")
+
+    monkeypatch.setattr(os.path, "getsize", no_stat)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+
+    ArchiveProcessor.process_file_with_archives(writer, str(plain), {}, level=0, file_size=3)
+
+    rows = list(csv.reader(io.StringIO(buffer.getvalue())))
+    assert rows == [["0", "", str(plain), "3", ""]]
+
+
+def test_iter_rows_matches_written_rows(tmp_path):
+    zip_path = tmp_path / "rows.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("a.txt", "aaa")
+        zf.writestr("b/c.txt", "cc")
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+    ArchiveProcessor.process_file_with_archives(writer, str(zip_path), {}, level=0)
+
+    rows = list(ArchiveProcessor.iter_rows(str(zip_path), {}, 0))
+    assert rows == list(csv.reader(io.StringIO(buffer.getvalue())))
+    assert [row[2] for row in rows] == [str(zip_path), "a.txt", "b/c.txt"]
+
+
+def test_archive_extension_normalizes_compressed_tars():
+    assert _archive_extension("C:/Data/Backup.ZIP") == ".zip"
+    assert _archive_extension("logs.Tar.GZ") == ".tar.gz"
+    assert _archive_extension("logs.tar.xz") == ".tar.xz"
+    assert _archive_extension("notes.txt.gz") == ".gz"
+    assert _archive_extension("archive.tgz") == ".tgz"
+    assert _archive_extension("README") == ""
+
+
+def test_gz_size_counted_across_chunks(tmp_path, monkeypatch):
+    import utils.archive_utils as archive_utils
+
+    gz_path = tmp_path / "big.bin.gz"
+    content = os.urandom(10_000) * 3
+    with gzip.open(gz_path, "wb") as gz_file:
+        gz_file.write(content)
+
+    monkeypatch.setattr(archive_utils, "GZ_READ_CHUNK_SIZE", 4096)
+    rows = list(ArchiveProcessor.iter_rows(str(gz_path), None, 0))
+
+    assert rows[1][2] == "big.bin"
+    assert rows[1][3] == str(len(content))
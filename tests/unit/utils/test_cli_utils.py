@@ -93,3 +93,40 @@ def test_compute_hashes_captures_errors(tmp_path, monkeypatch):
     hashes = cli_utils.compute_hashes([str(f1)], progress_step=1, print_fn=lambda msg: None)
 
     assert hashes[str(f1)].startswith("ERROR: fail")
+
+
+def test_compute_hashes_reports_at_percentage_checkpoints(tmp_path, monkeypatch):
+    files = []
+    for i in range(200):
+        path = tmp_path / f"f{i}.txt"
+        path.write_text("x", encoding="utf-8")
+        files.append(str(path))
+
+    monkeypatch.setattr(cli_utils, "calculate_file_hash", lambda path, algorithm='sha256': "HASH")
+
+    calls = []
+    cli_utils.compute_hashes(files, print_fn=calls.append)
+
+    assert calls == [f"Processed {n}/200 files" for n in (2, 10, 20, 50, 100, 150, 200)]
+
+
+def test_compute_hashes_parallel_keeps_file_order(tmp_path, monkeypatch):
+    import threading
+    import time
+
+    files = [str(tmp_path / f"f{i}.txt") for i in range(20)]
+    threads = set()
+
+    def slow_hash(path, algorithm='sha256'):
+        threads.add(threading.get_ident())
+        time.sleep(0.001 * (20 - int(os.path.basename(path)[1:-4])))
+        return f"HASH-{os.path.basename(path)}"
+
+    monkeypatch.setattr(cli_utils, "calculate_file_hash", slow_hash)
+    calls = []
+
+    hashes = cli_utils.compute_hashes(files, progress_step=1, print_fn=calls.append, workers=4)
+
+    assert list(hashes) == files
+    assert hashes[files[3]] == "HASH-f3.txt"
+    assert calls == [f"Processed {i}/20 files" for i in range(1, 21)]
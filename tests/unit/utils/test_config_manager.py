@@ -34,3 +34,16 @@ def test_get_list_parses_comma_values(tmp_path):
     cm = ConfigManager(str(cfg_path))
     parsed = cm.get_list("UI", "MediaTypes")
     assert parsed == ["Flash", "SSD"]
+
+
+def test_valid_transfer_types_include_names_and_abbreviations(tmp_path):
+    cfg_path = tmp_path / "config.ini"
+    cfg_path.write_text("[UI]\nTransferTypes=Low to High:L2H, High to Low:H2L\n", encoding="utf-8")
+    cm = ConfigManager(str(cfg_path))
+    valid = cm.get_valid_transfer_types()
+    assert valid == {"Low to High", "L2H", "High to Low", "H2L"}
+    assert cm.get_valid_transfer_types() is valid
+
+    cfg_path.write_text("[UI]\nTransferTypes=High to High:H2H\n", encoding="utf-8")
+    cm.reload()
+    assert cm.get_valid_transfer_types() == {"High to High", "H2H"}
@@ -12,11 +12,11 @@ class DummyConfig:
 def test_save_file_list_writes_rows_and_uses_hashes(tmp_path, monkeypatch):
     captured_paths = []
 
-    def fake_process(writer, display_path, normalized_hashes, level, container, hash_calc):
+    def fake_process(display_path, normalized_hashes, level, container, hash_calc, file_size=None):
         captured_paths.append(display_path)
-        writer.writerow([display_path, normalized_hashes.get(display_path, "") if normalized_hashes else ""])
+        yield [display_path, normalized_hashes.get(display_path, "") if normalized_hashes else ""]
 
-    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "process_file_with_archives", fake_process)
+    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "iter_rows", fake_process)
 
     f1 = tmp_path / "a.txt"
     f1.write_text("data", encoding="utf-8")
@@ -47,10 +47,10 @@ def test_save_file_list_increments_counter(tmp_path, monkeypatch):
     existing = tmp_path / "001.csv"
     existing.write_text("pre-existing", encoding="utf-8")
 
-    def no_op(writer, display_path, normalized_hashes, level, container, hash_calc):
-        writer.writerow([display_path])
+    def no_op(display_path, normalized_hashes, level, container, hash_calc, file_size=None):
+        yield [display_path]
 
-    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "process_file_with_archives", no_op)
+    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "iter_rows", no_op)
 
     f1 = tmp_path / "b.txt"
     f1.write_text("data", encoding="utf-8")
@@ -70,10 +70,10 @@ def test_save_file_list_increments_counter(tmp_path, monkeypatch):
 
 
 def test_save_file_list_handles_cancel(tmp_path, monkeypatch):
-    def fake_process(writer, display_path, normalized_hashes, level, container, hash_calc):
-        writer.writerow([display_path])
+    def fake_process(display_path, normalized_hashes, level, container, hash_calc, file_size=None):
+        yield [display_path]
 
-    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "process_file_with_archives", fake_process)
+    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "iter_rows", fake_process)
 
     f1 = tmp_path / "c.txt"
     f1.write_text("data", encoding="utf-8")
@@ -94,10 +94,10 @@ def test_save_file_list_handles_cancel(tmp_path, monkeypatch):
 
 
 def test_save_file_list_cleans_on_error(tmp_path, monkeypatch):
-    def boom(writer, display_path, normalized_hashes, level, container, hash_calc):
+    def boom(display_path, normalized_hashes, level, container, hash_calc, file_size=None):
         raise RuntimeError("fail")
 
-    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "process_file_with_archives", boom)
+    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "iter_rows", boom)
 
     f1 = tmp_path / "d.txt"
     f1.write_text("data", encoding="utf-8")
@@ -117,10 +117,10 @@ def test_save_file_list_cleans_on_error(tmp_path, monkeypatch):
 
 
 def test_save_file_list_reports_progress(tmp_path, monkeypatch):
-    def fake_process(writer, display_path, normalized_hashes, level, container, hash_calc):
-        writer.writerow([display_path])
+    def fake_process(display_path, normalized_hashes, level, container, hash_calc, file_size=None):
+        yield [display_path]
 
-    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "process_file_with_archives", fake_process)
+    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "iter_rows", fake_process)
 
     f1 = tmp_path / "e1.txt"
     f2 = tmp_path / "e2.txt"
@@ -154,10 +154,10 @@ def test_save_file_list_uses_default_path_formatter_and_handles_bad_hash_map(tmp
         def items(self):
             raise ValueError("boom")
 
-    def fake_process(writer, display_path, normalized_hashes, level, container, hash_calc):
-        writer.writerow([display_path, normalized_hashes])
+    def fake_process(display_path, normalized_hashes, level, container, hash_calc, file_size=None):
+        yield [display_path, normalized_hashes]
 
-    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "process_file_with_archives", fake_process)
+    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "iter_rows", fake_process)
 
     f1 = tmp_path / "f.txt"
     f1.write_text("data", encoding="utf-8")
@@ -179,10 +179,10 @@ def test_save_file_list_uses_default_path_formatter_and_handles_bad_hash_map(tmp
 
 
 def test_save_file_list_progress_callback_exception_is_swallowed(tmp_path, monkeypatch):
-    def fake_process(writer, display_path, normalized_hashes, level, container, hash_calc):
-        writer.writerow([display_path])
+    def fake_process(display_path, normalized_hashes, level, container, hash_calc, file_size=None):
+        yield [display_path]
 
-    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "process_file_with_archives", fake_process)
+    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "iter_rows", fake_process)
 
     f1 = tmp_path / "g1.txt"
     f2 = tmp_path / "g2.txt"
@@ -206,3 +206,224 @@ def test_save_file_list_progress_callback_exception_is_swallowed(tmp_path, monke
     )
 
     assert os.path.exists(out)
+
+
+def test_save_file_list_accepts_plain_progress_callable(tmp_path, monkeypatch):
+    def fake_process(display_path, normalized_hashes, level, container, hash_calc, file_size=None):
+        yield [display_path]
+
+    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "iter_rows", fake_process)
+
+    f1 = tmp_path / "h1.txt"
+    f2 = tmp_path / "h2.txt"
+    f1.write_text("data", encoding="utf-8")
+    f2.write_text("more", encoding="utf-8")
+
+    progresses = []
+
+    out = file_list_writer.save_file_list_with_progress(
+        output_dir=str(tmp_path),
+        files=[str(f1), str(f2)],
+        file_hashes=None,
+        csv_headers=["Path"],
+        filename_template="{counter}.csv",
+        template_data={},
+        config=DummyConfig(),
+        progress_callback=progresses.append,
+        path_formatter=lambda p: p,
+    )
+
+    assert os.path.exists(out)
+    assert progresses == [50, 100]
+
+
+def test_save_file_list_flushes_row_batches_in_order(tmp_path, monkeypatch):
+    def fake_process(display_path, normalized_hashes, level, container, hash_calc, file_size=None):
+        yield [display_path]
+
+    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "iter_rows", fake_process)
+    monkeypatch.setattr(file_list_writer, "ROW_BATCH_SIZE", 2)
+
+    files = []
+    for i in range(5):
+        path = tmp_path / f"batch{i}.txt"
+        path.write_text("x", encoding="utf-8")
+        files.append(str(path))
+
+    out = file_list_writer.save_file_list_with_progress(
+        output_dir=str(tmp_path),
+        files=files,
+        file_hashes=None,
+        csv_headers=["Path"],
+        filename_template="{counter}.csv",
+        template_data={},
+        config=DummyConfig(),
+        path_formatter=lambda p: p,
+    )
+
+    with open(out, newline="", encoding="utf-8") as fh:
+        rows = list(csv.reader(fh))
+    assert rows == [["Path"]] + [[p] for p in files]
+
+
+def test_save_file_list_without_counter_token_overwrites_existing(tmp_path, monkeypatch):
+    existing = tmp_path / "fixed.csv"
+    existing.write_text("stale", encoding="utf-8")
+
+    def fake_process(display_path, normalized_hashes, level, container, hash_calc, file_size=None):
+        yield [display_path]
+
+    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "iter_rows", fake_process)
+
+    formatted = []
+    real_compile = file_list_writer.compile_filename
+
+    def counting_compile(*args, **kwargs):
+        filename_for = real_compile(*args, **kwargs)
+
+        def counting_format(counter):
+            formatted.append(counter)
+            return filename_for(counter)
+
+        return counting_format
+
+    monkeypatch.setattr(file_list_writer, "compile_filename", counting_compile)
+
+    f1 = tmp_path / "i.txt"
+    f1.write_text("data", encoding="utf-8")
+
+    out = file_list_writer.save_file_list_with_progress(
+        output_dir=str(tmp_path),
+        files=[str(f1)],
+        file_hashes=None,
+        csv_headers=["Path"],
+        filename_template="fixed.csv",
+        template_data={},
+        config=DummyConfig(),
+        path_formatter=lambda p: p,
+    )
+
+    assert out == str(existing)
+    assert len(formatted) == 2
+    with open(out, newline="", encoding="utf-8") as fh:
+        assert list(csv.reader(fh)) == [["Path"], [str(f1)]]
+
+
+def test_save_file_list_keeps_input_order_with_parallel_workers(tmp_path, monkeypatch):
+    import time
+
+    files = []
+    for i in range(12):
+        path = tmp_path / f"order{i:02d}.txt"
+        path.write_text("x", encoding="utf-8")
+        files.append(str(path))
+
+    def slow_first(display_path, normalized_hashes, level, container, hash_calc, file_size=None):
+        # Earlier files finish last, so completion order is the reverse of input order
+        time.sleep((len(files) - files.index(display_path)) * 0.002)
+        yield [display_path]
+
+    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "iter_rows", slow_first)
+
+    out = file_list_writer.save_file_list_with_progress(
+        output_dir=str(tmp_path),
+        files=files,
+        file_hashes=None,
+        csv_headers=["Path"],
+        filename_template="{counter}.csv",
+        template_data={},
+        config=DummyConfig(),
+        path_formatter=lambda p: p,
+    )
+
+    with open(out, newline="", encoding="utf-8") as fh:
+        rows = list(csv.reader(fh))
+    assert rows[1:] == [[p] for p in files]
+
+
+def test_save_file_list_emits_each_percentage_once(tmp_path, monkeypatch):
+    def fake_process(display_path, normalized_hashes, level, container, hash_calc, file_size=None):
+        yield [display_path]
+
+    monkeypatch.setattr(file_list_writer.ArchiveProcessor, "iter_rows", fake_process)
+
+    files = []
+    for i in range(300):
+        path = tmp_path / f"p{i}.txt"
+        path.write_text("x", encoding="utf-8")
+        files.append(str(path))
+
+    progresses = []
+    cancel_checks = []
+
+    def never_cancel():
+        cancel_checks.append(True)
+        return False
+
+    file_list_writer.save_file_list_with_progress(
+        output_dir=str(tmp_path),
+        files=files,
+        file_hashes=None,
+        csv_headers=["Path"],
+        filename_template="{counter}.csv",
+        template_data={},
+        config=DummyConfig(),
+        progress_callback=progresses.append,
+        cancel_check=never_cancel,
+        path_formatter=lambda p: p,
+    )
+
+    assert progresses == list(range(0, 101))
+    assert len(cancel_checks) == -(-300 // file_list_writer.CANCEL_CHECK_INTERVAL)
+
+
+def test_create_unique_file_lists_directory_once_on_collision(tmp_path, monkeypatch):
+    for counter in range(1, 6):
+        (tmp_path / f"list_{counter:03d}.csv").write_text("old", encoding="utf-8")
+
+    real_open = os.open
+    real_listdir = os.listdir
+    opened = []
+    listed = []
+
+    def tracking_open(path, flags, mode=0o777):
+        opened.append(os.path.basename(path))
+        return real_open(path, flags, mode)
+
+    def tracking_listdir(path):
+        listed.append(path)
+        return real_listdir(path)
+
+    monkeypatch.setattr(file_list_writer.os, "open", tracking_open)
+    monkeypatch.setattr(file_list_writer.os, "listdir", tracking_listdir)
+
+    fd, path = file_list_writer._create_unique_file(str(tmp_path), "list_{counter}.csv", {}, DummyConfig())
+    os.close(fd)
+
+    assert os.path.basename(path) == "list_006.csv"
+    assert opened == ["list_001.csv", "list_006.csv"]
+    assert listed == [str(tmp_path)]
+
+
+def test_save_file_list_fsyncs_once_when_configured(tmp_path, monkeypatch):
+    class SyncConfig(DummyConfig):
+        def get(self, section, option, fallback=None):
+            if (section, option) == ("Logging", "FsyncOnWrite"):
+                return "true"
+            return fallback
+
+    synced = []
+    monkeypatch.setattr(file_list_writer.os, "fsync", lambda fd: synced.append(fd))
+
+    files = []
+    for i in range(3):
+        path = tmp_path / f"s{i}.txt"
+        path.write_text("x", encoding="utf-8")
+        files.append(str(path))
+
+    kwargs = dict(output_dir=str(tmp_path), files=files, file_hashes=None, csv_headers=["Path"],
+                  filename_template="list_{counter}.csv", template_data={}, path_formatter=lambda p: p)
+    assert file_list_writer.save_file_list_with_progress(config=DummyConfig(), **kwargs)
+    assert synced == []
+    assert file_list_writer.save_file_list_with_progress(config=SyncConfig(), **kwargs)
+    assert len(synced) == 1
@@ -1,4 +1,7 @@
 import os
+
+import pytest
+
 from utils import file_utils
 
 
@@ -45,3 +48,131 @@ def test_format_filename_custom_format_specifiers():
     result = file_utils.format_filename(template)
     assert len(result.split("_")) == 2
     assert result.endswith(".log")
+
+
+def test_format_csv_row_matches_csv_writer_quote_all():
+    import csv
+    import io
+
+    fields = ["plain", 'with "quotes"', "comma,inside", "", None, 42, "line\nbreak"]
+    buffer = io.StringIO(newline="")
+    csv.writer(buffer, quoting=csv.QUOTE_ALL).writerow(fields)
+    assert file_utils.format_csv_row(fields) == buffer.getvalue()
+
+
+def test_get_file_size_str_unit_boundaries():
+    assert file_utils.get_file_size_str(0) == "0 B"
+    assert file_utils.get_file_size_str(1023) == "1023 B"
+    assert file_utils.get_file_size_str(1024) == "1.00 KB"
+    assert file_utils.get_file_size_str(1024 * 1024 - 1) == "1024.00 KB"
+    assert file_utils.get_file_size_str(1024 * 1024) == "1.00 MB"
+    assert file_utils.get_file_size_str(1024 ** 3) == "1.00 GB"
+    assert file_utils.get_file_size_str(5 * 1024 ** 4) == "5120.00 GB"
+
+
+def test_file_info_derived_values_follow_changes():
+    info = file_utils.FileInfo(os.path.join("dir", "a.txt"), size=512)
+    assert (info.directory, info.name, info.size_str) == ("dir", "a.txt", "512 B")
+
+    info.path = os.path.join("other", "b.txt")
+    info.size = 2048
+    assert (info.directory, info.name, info.size_str) == ("other", "b.txt", "2.00 KB")
+
+
+def test_compile_filename_only_varies_counter():
+    filename_for = file_utils.compile_filename("{username}_{year}_{counter}.csv", config=DummyConfig())
+    first, second = filename_for(1), filename_for(12)
+    assert first.endswith("_001.csv")
+    assert second == first[:-len("001.csv")] + "012.csv"
+    assert file_utils.format_filename("{username}_{year}_{counter}.csv", config=DummyConfig(), counter=1) == first
+
+
+def test_format_csv_row_empty_row_matches_csv_writer():
+    import csv
+    import io
+
+    buffer = io.StringIO(newline="")
+    csv.writer(buffer, quoting=csv.QUOTE_ALL).writerow([])
+    assert file_utils.format_csv_row([]) == buffer.getvalue()
+
+
+def test_calculate_file_hash_with_and_without_file_digest(tmp_path, monkeypatch):
+    import hashlib
+
+    data = os.urandom(200_000)
+    target = tmp_path / "data.bin"
+    target.write_bytes(data)
+
+    expected = hashlib.sha256(data).hexdigest()
+    assert file_utils.calculate_file_hash(str(target)) == expected
+
+    # Python 3.10 has no hashlib.file_digest; the readinto loop must agree
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    assert file_utils.calculate_file_hash(str(target), buffer_size=4096) == expected
+    assert file_utils.calculate_file_hash(str(target), algorithm="md5") == hashlib.md5(data).hexdigest()
+
+
+def test_calculate_file_hash_memory_mapped(tmp_path, monkeypatch):
+    import hashlib
+
+    data = os.urandom(50_000)
+    target = tmp_path / "mapped.bin"
+    target.write_bytes(data)
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+
+    monkeypatch.setattr(file_utils, "_MMAP_HASH_THRESHOLD", 1)
+    assert file_utils.calculate_file_hash(str(target)) == hashlib.sha256(data).hexdigest()
+    # Empty files cannot be mapped and go through the regular read path
+    assert file_utils.calculate_file_hash(str(empty)) == hashlib.sha256(b"").hexdigest()
+
+
+def test_append_csv_row_writes_headers_once(tmp_path):
+    import csv
+
+    log_file = tmp_path / "TransferLog_2025.log"
+    file_utils.append_csv_row(str(log_file), ["1", 'say "hi"', "Zoë"], ["A", "B", "C"])
+    file_utils.append_csv_row(str(log_file), ["2", "", None], ["A", "B", "C"])
+
+    raw = log_file.read_bytes()
+    assert raw.count(b'"A","B","C"\r\n') == 1
+    with open(log_file, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows == [["A", "B", "C"], ["1", 'say "hi"', "Zoë"], ["2", "", ""]]
+
+
+def test_compile_filename_counter_matches_sanitize_filename():
+    config = DummyConfig()
+    long_name = "x" * 250
+    for template, data in [("{purpose}_{counter}.csv", {"purpose": 'a:b/"c"'}),
+                           ("{purpose}_{counter}.csv", {"purpose": long_name})]:
+        filename_for = file_utils.compile_filename(template, data, config)
+        raw = template.replace("{purpose}", data["purpose"])
+        for counter in (1, 42, 999):
+            expected = file_utils.sanitize_filename(raw.replace("{counter}", f"{counter:03d}"))
+            assert filename_for(counter) == expected
+
+
+def test_get_all_files_with_sizes_matches_get_all_files(tmp_path):
+    (tmp_path / "a.txt").write_bytes(b"abc")
+    nested = tmp_path / "sub" / "deeper"
+    nested.mkdir(parents=True)
+    (nested / "b.bin").write_bytes(b"\0" * 10)
+    (tmp_path / "sub" / "c.txt").write_bytes(b"")
+
+    with_sizes = file_utils.get_all_files_with_sizes(str(tmp_path))
+
+    assert [path for path, _ in with_sizes] == file_utils.get_all_files(str(tmp_path))
+    assert all(size == os.path.getsize(path) for path, size in with_sizes)
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs os.mkfifo and symlinks")
+def test_iter_files_with_sizes_skips_non_regular_files(tmp_path):
+    (tmp_path / "a.txt").write_bytes(b"abc")
+    os.mkfifo(tmp_path / "pipe")
+    os.symlink(tmp_path / "missing", tmp_path / "broken")
+    os.symlink(tmp_path / "a.txt", tmp_path / "link.txt")
+
+    found = sorted(file_utils.iter_files_with_sizes(str(tmp_path)))
+
+    assert found == [(str(tmp_path / "a.txt"), 3), (str(tmp_path / "link.txt"), 3)]